@@ -3,16 +3,19 @@ Speech Flow API Gateway
 Handles job submission, status checks, and result retrieval
 """
 
+import asyncio
 import json
+import posixpath
 import uuid
 from datetime import datetime, timedelta
-from typing import List, Literal, Optional
+from typing import BinaryIO, List, Literal, Optional
 
 from config import settings
-from database import get_db
-from fastapi import Depends, FastAPI, HTTPException, Query
+from database import SessionLocal, get_db
+from fastapi import Depends, FastAPI, File, Form, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from models import Job, JobStep
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, ValidationError, model_validator
 from sqlalchemy.orm import Session
 
 # Import adapters for multi-environment support
@@ -31,6 +34,13 @@ except ImportError:
 
 app = FastAPI(title="Speech Flow API", description="Event-driven speech processing pipeline", version="1.0.0")
 
+# Job status event stream settings
+# Lowercase; the router writes uppercase statuses ("COMPLETED", "FAILED"), so compare case-insensitively
+TERMINAL_JOB_STATUSES = ("completed", "partial_complete", "failed", "cancelled")
+JOB_EVENTS_POLL_SECONDS = 1.0
+JOB_EVENTS_KEEPALIVE_SECONDS = 15.0
+JOB_EVENTS_MAX_SECONDS = 300.0
+
 
 # ============== Request/Response Models ==============
 
@@ -143,7 +153,7 @@ def get_storage_client():
         return BlobServiceClient.from_connection_string(settings.AZURE_STORAGE_CONNECTION_STRING)
 
 
-def generate_upload_sas_url(job_id: str, filename: str) -> str:
+async def generate_upload_sas_url(job_id: str, filename: str) -> str:
     """Generate a SAS URL for uploading audio file.
     For Azurite/local development, ensure the URL points to the local BlobEndpoint,
     and use an API version compatible with Azurite.
@@ -153,7 +163,7 @@ def generate_upload_sas_url(job_id: str, filename: str) -> str:
 
     if USE_ADAPTERS:
         storage = get_storage_adapter(settings.AZURE_STORAGE_CONNECTION_STRING)
-        return storage.generate_upload_url(container_name, blob_name)
+        return await storage.agenerate_upload_url(container_name, blob_name)
     else:
         from azure.storage.blob import (
             AccountSasPermissions,
@@ -188,13 +198,31 @@ def generate_upload_sas_url(job_id: str, filename: str) -> str:
         return f"{base_url}/{container_name}/{blob_name}?{sas_token}"
 
 
-def read_blob_json(container_name: str, blob_name: str) -> Optional[dict]:
+async def upload_audio_stream(job_id: str, filename: str, stream: BinaryIO, length: Optional[int] = None) -> str:
+    """Stream an uploaded audio file into blob storage and return its blob path"""
+    container_name = settings.BLOB_CONTAINER_NAME
+    blob_name = f"{job_id}/{filename}"
+
+    if USE_ADAPTERS:
+        storage = get_storage_adapter(settings.AZURE_STORAGE_CONNECTION_STRING)
+        await storage.aupload_stream(container_name, blob_name, stream, length=length)
+    else:
+        from azure.storage.blob import BlobServiceClient
+
+        blob_service_client = BlobServiceClient.from_connection_string(settings.AZURE_STORAGE_CONNECTION_STRING)
+        blob_client = blob_service_client.get_blob_client(container=container_name, blob=blob_name)
+        await asyncio.to_thread(blob_client.upload_blob, stream, length=length, overwrite=True)
+
+    return blob_name
+
+
+async def read_blob_json(container_name: str, blob_name: str) -> Optional[dict]:
     """Read JSON content from a blob"""
     try:
         if USE_ADAPTERS:
             storage = get_storage_adapter(settings.AZURE_STORAGE_CONNECTION_STRING)
-            if storage.blob_exists(container_name, blob_name):
-                content = storage.download_blob(container_name, blob_name)
+            if await storage.ablob_exists(container_name, blob_name):
+                content = await storage.adownload_blob(container_name, blob_name)
                 return json.loads(content.decode("utf-8"))
         else:
             from azure.storage.blob import BlobServiceClient
@@ -270,28 +298,48 @@ def send_job_event(
                 sender.send_messages(message)
 
 
-# ============== API Endpoints ==============
+# ============== Job Helpers ==============
 
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "speech-flow-api"}
+def build_job_status(db: Session, job_id: str) -> Optional[JobStatusResponse]:
+    """Load a job and its steps, or None if the job does not exist"""
+    job = db.query(Job).filter(Job.job_id == job_id).first()
 
+    if not job:
+        return None
 
-@app.post("/jobs", response_model=JobResponse)
-async def submit_job(request: JobSubmitRequest, db: Session = Depends(get_db)):
-    """
-    Submit a new speech processing job.
+    # Get processing steps
+    steps = db.query(JobStep).filter(JobStep.job_id == job_id).all()
 
-    Returns a SAS URL for uploading the audio file.
-    After upload, call POST /jobs/{job_id}/start to begin processing.
-    """
-    job_id = str(uuid.uuid4())
+    step_statuses = [
+        StepStatus(
+            step_type=step.step_name,
+            status=step.status,
+            started_at=step.started_at,
+            completed_at=step.completed_at,
+            error_message=step.error_message,
+            retry_count=step.retry_count,
+        )
+        for step in steps
+    ]
 
-    # Create job record
+    return JobStatusResponse(
+        job_id=str(job.job_id),
+        status=job.status,
+        workflow_type=job.workflow_type,
+        audio_filename=job.audio_filename,
+        source_language=job.source_language,
+        target_language=job.target_language,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        steps=step_statuses,
+    )
+
+
+def create_job(db: Session, request: JobSubmitRequest) -> Job:
+    """Insert a job record awaiting its audio upload"""
     job = Job(
-        job_id=job_id,
+        job_id=str(uuid.uuid4()),
         customer_id="default",  # Default customer ID for simple UI
         audio_filename=request.audio_filename,
         workflow_type=request.workflow_type,
@@ -303,9 +351,57 @@ async def submit_job(request: JobSubmitRequest, db: Session = Depends(get_db)):
 
     db.add(job)
     db.commit()
+    return job
+
+
+def queue_job(db: Session, job: Job, blob_path: str) -> None:
+    """Mark an uploaded job as queued and hand it to the router"""
+    job.status = "queued"
+    job.updated_at = datetime.utcnow()
+    db.commit()
+
+    send_job_event(
+        job_id=str(job.job_id),
+        workflow_type=job.workflow_type,
+        audio_path=blob_path,
+        source_language=job.source_language,
+        target_language=job.target_language,
+        callback_url=job.callback_url,
+    )
+
+
+def load_job_status(job_id: str) -> Optional[JobStatusResponse]:
+    """Read job status with a short-lived session (safe to run in a worker thread)"""
+    db = SessionLocal()
+    try:
+        return build_job_status(db, job_id)
+    finally:
+        db.close()
+
+
+# ============== API Endpoints ==============
+
+
+@app.get("/health")
+async def health_check():
+    """Health check endpoint"""
+    return {"status": "healthy", "service": "speech-flow-api"}
+
+
+@app.post("/jobs", response_model=JobResponse)
+async def submit_job(request: JobSubmitRequest, db: Session = Depends(get_db)):
+    """
+    Submit a new speech processing job.
+
+    Returns a SAS URL for uploading the audio file.
+    After upload, call POST /jobs/{job_id}/start to begin processing.
+    """
+    # Create job record
+    job = create_job(db, request)
+    job_id = str(job.job_id)
 
     # Generate upload URL
-    upload_url = generate_upload_sas_url(job_id, request.audio_filename)
+    upload_url = await generate_upload_sas_url(job_id, request.audio_filename)
 
     return JobResponse(
         job_id=job_id,
@@ -333,7 +429,7 @@ async def start_job(job_id: str, db: Session = Depends(get_db)):
 
     if USE_ADAPTERS:
         storage = get_storage_adapter(settings.AZURE_STORAGE_CONNECTION_STRING)
-        blob_exists = storage.blob_exists(settings.BLOB_CONTAINER_NAME, blob_path)
+        blob_exists = await storage.ablob_exists(settings.BLOB_CONTAINER_NAME, blob_path)
     else:
         from azure.storage.blob import BlobServiceClient
 
@@ -345,20 +441,54 @@ async def start_job(job_id: str, db: Session = Depends(get_db)):
     if not blob_exists:
         raise HTTPException(status_code=400, detail="Audio file not found. Please upload the file first.")
 
-    # Update job status
-    job.status = "queued"
-    job.updated_at = datetime.utcnow()
-    db.commit()
+    # Update job status and send event to router
+    queue_job(db, job, blob_path)
 
-    # Send event to router
-    send_job_event(
-        job_id=job_id,
-        workflow_type=job.workflow_type,
-        audio_path=blob_path,
-        source_language=job.source_language,
-        target_language=job.target_language,
-        callback_url=job.callback_url,
-    )
+    return JobResponse(job_id=job_id, status="queued", message="Job submitted for processing")
+
+
+@app.post("/jobs/upload", response_model=JobResponse)
+async def submit_job_with_audio(
+    audio_file: UploadFile = File(..., description="Audio file to process"),
+    workflow_type: str = Form("full_pipeline"),
+    source_language: Optional[str] = Form(None),
+    target_language: Optional[str] = Form("en"),
+    callback_url: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Submit a job, upload its audio and start processing in a single request.
+
+    Equivalent to POST /jobs, uploading to the returned URL, then POST /jobs/{job_id}/start.
+    """
+    # The filename becomes part of the blob path: keep only its final component
+    filename = posixpath.basename((audio_file.filename or "").replace("\\", "/"))
+    if filename in ("", ".", ".."):
+        raise HTTPException(status_code=422, detail="Invalid audio filename")
+
+    try:
+        request = JobSubmitRequest(
+            audio_filename=filename,
+            workflow_type=workflow_type,
+            source_language=source_language,
+            target_language=target_language,
+            callback_url=callback_url,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    job = create_job(db, request)
+    job_id = str(job.job_id)
+
+    try:
+        blob_path = await upload_audio_stream(job_id, request.audio_filename, audio_file.file, audio_file.size)
+    except Exception:
+        # Don't leave the job waiting in pending_upload for audio that will never arrive
+        job.status = "failed"
+        job.updated_at = datetime.utcnow()
+        db.commit()
+        raise HTTPException(status_code=502, detail="Audio upload to storage failed")
+    queue_job(db, job, blob_path)
 
     return JobResponse(job_id=job_id, status="queued", message="Job submitted for processing")
 
@@ -368,36 +498,56 @@ async def get_job_status(job_id: str, db: Session = Depends(get_db)):
     """
     Get detailed status of a job including all processing steps.
     """
-    job = db.query(Job).filter(Job.job_id == job_id).first()
+    status = build_job_status(db, job_id)
 
-    if not job:
+    if status is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Get processing steps
-    steps = db.query(JobStep).filter(JobStep.job_id == job_id).all()
+    return status
 
-    step_statuses = [
-        StepStatus(
-            step_type=step.step_name,
-            status=step.status,
-            started_at=step.started_at,
-            completed_at=step.completed_at,
-            error_message=step.error_message,
-            retry_count=step.retry_count,
-        )
-        for step in steps
-    ]
 
-    return JobStatusResponse(
-        job_id=str(job.job_id),
-        status=job.status,
-        workflow_type=job.workflow_type,
-        audio_filename=job.audio_filename,
-        source_language=job.source_language,
-        target_language=job.target_language,
-        created_at=job.created_at,
-        updated_at=job.updated_at,
-        steps=step_statuses,
+@app.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """
+    Stream job status as server-sent events.
+
+    A `status` event is pushed with the current state on connect and again whenever the
+    job or any of its steps change. The stream closes once the job reaches a terminal
+    state, or after JOB_EVENTS_MAX_SECONDS so clients reconnect periodically.
+    """
+    status = await asyncio.to_thread(load_job_status, job_id)
+
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def event_stream():
+        nonlocal status
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + JOB_EVENTS_MAX_SECONDS
+        last_payload = None
+        last_sent = loop.time()
+
+        while status is not None:
+            payload = status.model_dump_json()
+            if payload != last_payload:
+                yield f"event: status\ndata: {payload}\n\n"
+                last_payload = payload
+                last_sent = loop.time()
+            elif loop.time() - last_sent >= JOB_EVENTS_KEEPALIVE_SECONDS:
+                # SSE comment line keeps proxies from closing an idle connection
+                yield ": keepalive\n\n"
+                last_sent = loop.time()
+
+            if (status.status or "").lower() in TERMINAL_JOB_STATUSES or loop.time() >= deadline:
+                break
+
+            await asyncio.sleep(JOB_EVENTS_POLL_SECONDS)
+            status = await asyncio.to_thread(load_job_status, job_id)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -427,13 +577,13 @@ async def get_job_results(job_id: str, db: Session = Depends(get_db)):
 
     # Get LID result
     if "LID" in completed_steps:
-        lid_result = read_blob_json(settings.RESULTS_CONTAINER_NAME, f"{job_id}/lid_result.json")
+        lid_result = await read_blob_json(settings.RESULTS_CONTAINER_NAME, f"{job_id}/lid_result.json")
         if lid_result:
             results.detected_language = lid_result.get("detected_language")
 
     # Get transcription result
     if "TRANSCRIBE" in completed_steps:
-        transcription_result = read_blob_json(settings.RESULTS_CONTAINER_NAME, f"{job_id}/transcription.json")
+        transcription_result = await read_blob_json(settings.RESULTS_CONTAINER_NAME, f"{job_id}/transcription.json")
         if transcription_result:
             results.transcription = TranscriptionResult(
                 language=transcription_result.get("language", "unknown"),
@@ -443,7 +593,7 @@ async def get_job_results(job_id: str, db: Session = Depends(get_db)):
 
     # Get translation result
     if "TRANSLATE" in completed_steps:
-        translation_result = read_blob_json(settings.RESULTS_CONTAINER_NAME, f"{job_id}/translation.json")
+        translation_result = await read_blob_json(settings.RESULTS_CONTAINER_NAME, f"{job_id}/translation.json")
         if translation_result:
             results.translation = TranslationResult(
                 source_language=translation_result.get("source_language", ""),
@@ -454,7 +604,7 @@ async def get_job_results(job_id: str, db: Session = Depends(get_db)):
 
     # Get summary result
     if "SUMMARIZE" in completed_steps:
-        summary_result = read_blob_json(settings.RESULTS_CONTAINER_NAME, f"{job_id}/summary.json")
+        summary_result = await read_blob_json(settings.RESULTS_CONTAINER_NAME, f"{job_id}/summary.json")
         if summary_result:
             results.summary = SummaryResult(
                 summary=summary_result.get("summary", ""), key_points=summary_result.get("key_points")
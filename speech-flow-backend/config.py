@@ -75,7 +75,7 @@ class Settings:
 
     # HuggingFace Models (for LOCAL mode)
     HF_SUMMARIZATION_MODEL: Final[str] = os.getenv("HF_SUMMARIZATION_MODEL", "facebook/bart-large-cnn")
-    HF_TRANSLATION_MODEL: Final[str] = os.getenv("HF_TRANSLATION_MODEL", "Helsinki-NLP/opus-mt-{src}-{tgt}")
+    HF_TRANSLATION_MODEL: Final[str] = os.getenv("HF_TRANSLATION_MODEL", "facebook/nllb-200-distilled-600M")
 
     @property
     def is_local_mode(self) -> bool:
@@ -0,0 +1,38 @@
+"""Queue-backed logging setup for long-running services.
+
+Log records are handed to an in-memory queue and written to stdout by a
+background QueueListener thread, so the event loop never blocks on the
+stdout lock or a write syscall.
+"""
+
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+
+def configure_queue_logging(logger_name: str) -> QueueListener:
+    """Attach a QueueHandler to a logger and start its background writer.
+
+    Args:
+        logger_name: Name of the logger to configure (e.g., "router")
+
+    Returns:
+        The started QueueListener; call stop() on shutdown to flush pending records
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    logger.handlers = [QueueHandler(log_queue)]
+    logger.propagate = False
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
@@ -7,12 +7,16 @@ This module provides a unified interface for message queue operations that works
 
 import os
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 
 
 class MessageBroker(ABC):
     """Abstract base class for message brokers."""
 
+    # Whether senders honour ServiceBusMessage.scheduled_enqueue_time_utc
+    supports_scheduled_delivery = True
+
     @abstractmethod
     async def get_queue_sender(self, queue_name: str):
         """Get a sender for a specific queue.
@@ -26,11 +30,12 @@ class MessageBroker(ABC):
         pass
 
     @abstractmethod
-    async def get_queue_receiver(self, queue_name: str):
+    async def get_queue_receiver(self, queue_name: str, prefetch_count: int = 0):
         """Get a receiver for a specific queue.
 
         Args:
             queue_name: Name of the queue
+            prefetch_count: Messages to buffer locally ahead of receive calls (0 = none)
 
         Returns:
             Queue receiver instance
@@ -78,9 +83,9 @@ class AzureServiceBusAdapter(MessageBroker):
         """Get a sender for a specific queue."""
         return self._client.get_queue_sender(queue_name=queue_name)
 
-    async def get_queue_receiver(self, queue_name: str):
+    async def get_queue_receiver(self, queue_name: str, prefetch_count: int = 0):
         """Get a receiver for a specific queue."""
-        return self._client.get_queue_receiver(queue_name=queue_name)
+        return self._client.get_queue_receiver(queue_name=queue_name, prefetch_count=prefetch_count)
 
     async def close(self):
         """Close the connection."""
@@ -102,6 +107,9 @@ class RabbitMQAdapter(MessageBroker):
     For production async use, consider using aio_pika instead.
     """
 
+    # Messages go through the default exchange, so they are always delivered immediately
+    supports_scheduled_delivery = False
+
     def __init__(self, connection_string: str):
         """Initialize RabbitMQ adapter.
 
@@ -137,8 +145,8 @@ class RabbitMQAdapter(MessageBroker):
         self.channel.queue_declare(queue=queue_name, durable=True)
         return RabbitMQSender(self.channel, queue_name)
 
-    async def get_queue_receiver(self, queue_name: str):
-        """Get a receiver for a specific queue."""
+    async def get_queue_receiver(self, queue_name: str, prefetch_count: int = 0):
+        """Get a receiver for a specific queue (prefetch is ignored: basic_get pulls on demand)."""
         await self._ensure_connection()
         # Declare queue
         self.channel.queue_declare(queue=queue_name, durable=True)
@@ -170,7 +178,12 @@ class RabbitMQSender:
         self._pika = pika
 
     async def send_messages(self, message):
-        """Send a message to the queue"""
+        """Send a message (or a list of messages) to the queue"""
+        if isinstance(message, list):
+            for single in message:
+                await self.send_messages(single)
+            return
+
         # Extract body from message (compatible with ServiceBusMessage interface)
         if hasattr(message, "body"):
             body = message.body
@@ -179,6 +192,7 @@ class RabbitMQSender:
         else:
             body = str(message)
 
+        # scheduled_enqueue_time_utc is not supported here (see RabbitMQAdapter.supports_scheduled_delivery)
         # Publish message to RabbitMQ
         self.channel.basic_publish(
             exchange="",
@@ -186,6 +200,7 @@ class RabbitMQSender:
             body=body,
             properties=self._pika.BasicProperties(
                 delivery_mode=2,  # make message persistent
+                content_type=getattr(message, "content_type", None),
             ),
         )
 
@@ -249,6 +264,13 @@ class RabbitMQMessage:
         self.delivery_tag = delivery_tag
         self.channel = channel
 
+    @property
+    def body(self) -> bytes:
+        """Return raw message body bytes"""
+        if isinstance(self._body, bytes):
+            return self._body
+        return str(self._body).encode("utf-8")
+
     def __str__(self):
         """Return message body as string"""
         if isinstance(self._body, bytes):
@@ -259,10 +281,19 @@ class RabbitMQMessage:
 class ServiceBusMessage:
     """Wrapper for messages to be sent"""
 
-    def __init__(self, body: str, message_id: Optional[str] = None, subject: Optional[str] = None):
+    def __init__(
+        self,
+        body: str,
+        message_id: Optional[str] = None,
+        subject: Optional[str] = None,
+        scheduled_enqueue_time_utc: Optional[datetime] = None,
+        content_type: Optional[str] = None,
+    ):
         self.body = body
         self.message_id = message_id
         self.subject = subject
+        self.scheduled_enqueue_time_utc = scheduled_enqueue_time_utc
+        self.content_type = content_type
 
 
 def get_message_broker(
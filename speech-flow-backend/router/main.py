@@ -1,19 +1,27 @@
 import asyncio
-import json
+import logging
 import os
+import random
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 import httpx
+import orjson
+
+try:
+    import msgpack
+except ImportError:  # only needed when workers run with WIRE_FORMAT=msgpack
+    msgpack = None
 
 # Add parent directory to path to import database/models
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import settings
 from database import SessionLocal
+from logging_config import configure_queue_logging
 from models import Job, JobStep
-from sqlalchemy.orm import Session
-from config import settings
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
 # Import adapters for multi-environment support
@@ -33,7 +41,13 @@ QUEUE_LID = settings.LID_QUEUE_NAME
 QUEUE_WHISPER = settings.WHISPER_QUEUE_NAME
 QUEUE_AZURE = settings.AZURE_AI_QUEUE_NAME
 
+logger = logging.getLogger("router")
+
 MAX_RETRIES = 3
+MAX_RETRY_DELAY_SECONDS = 32
+
+# Shared HTTP client for webhook callbacks (created in main(), reused across callbacks)
+_HTTP: Optional[httpx.AsyncClient] = None
 
 
 def _now_utc():
@@ -41,23 +55,71 @@ def _now_utc():
     return datetime.now(timezone.utc)
 
 
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared callback HTTP client, creating it on first use"""
+    global _HTTP
+    if _HTTP is None or _HTTP.is_closed:
+        _HTTP = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=50),
+            http2=True,
+        )
+    return _HTTP
+
+
+def _retry_delay_seconds(retry_count: int) -> float:
+    """Full-jitter exponential backoff delay for a retry attempt"""
+    return random.uniform(0, min(MAX_RETRY_DELAY_SECONDS, 2**retry_count))
+
+
+def _supports_scheduled_delivery(sender) -> bool:
+    """Whether the broker delays messages by scheduled_enqueue_time_utc (the Service Bus SDK client does)"""
+    return getattr(sender, "supports_scheduled_delivery", True)
+
+
 def _parse_iso_datetime(value):
     """Parse ISO datetime string to datetime object"""
     if not value:
         return None
     try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
-    except:
+        # Workers emit isoformat() with an explicit offset; only rewrite a trailing "Z"
+        if value[-1] == "Z":
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
         return None
 
 
+def _message_bytes(msg) -> bytes:
+    """Get the raw body of a received message without decoding it to str"""
+    body = msg.body
+    if isinstance(body, (bytes, bytearray)):
+        return body
+    # Service Bus exposes the body as an iterable of data sections
+    return b"".join(body)
+
+
+# First byte of a MessagePack map (fixmap, map16, map32); JSON events start with "{"
+_MSGPACK_MAP_PREFIXES = frozenset(range(0x80, 0x90)) | {0xDE, 0xDF}
+
+
+def _decode_message(msg) -> dict:
+    """Decode a router event sent as JSON or as MessagePack (workers with WIRE_FORMAT=msgpack)"""
+    raw = _message_bytes(msg)
+    if raw and raw[0] in _MSGPACK_MAP_PREFIXES:
+        if msgpack is None:
+            raise ValueError("Received a MessagePack event but msgpack is not installed")
+        return msgpack.unpackb(raw)
+    return orjson.loads(raw)
+
+
 async def get_job(db: Session, job_id: str):
     return db.query(Job).filter(Job.job_id == job_id).first()
 
 
-async def create_step(db: Session, job_id: str, step_name: str):
+async def create_step(db: Session, job_id: str, step_name: str, now: Optional[datetime] = None):
     """Create a new processing step with queue timestamp"""
-    step = JobStep(job_id=job_id, step_name=step_name, status="QUEUED", retry_count=0, queued_at=_now_utc())
+    step = JobStep(job_id=job_id, step_name=step_name, status="QUEUED", retry_count=0, queued_at=now or _now_utc())
     db.add(step)
     db.commit()
     return step
@@ -73,7 +135,14 @@ async def get_latest_step(db: Session, job_id: str, step_name: str):
 
 
 async def update_step_with_metrics(
-    db: Session, job_id: str, step_name: str, status: str, result: dict = None, metrics: dict = None, error: str = None
+    db: Session,
+    job_id: str,
+    step_name: str,
+    status: str,
+    result: dict = None,
+    metrics: dict = None,
+    error: str = None,
+    now: Optional[datetime] = None,
 ):
     """
     Update step status and persist all metrics from workers.
@@ -85,7 +154,7 @@ async def update_step_with_metrics(
 
     step.status = status
     step.error_message = error
-    step.completed_at = _now_utc()
+    step.completed_at = now or _now_utc()
 
     # Store result payload
     if result:
@@ -135,7 +204,7 @@ async def update_step_with_metrics(
     return step
 
 
-async def update_job_aggregates(db: Session, job_id: str):
+async def update_job_aggregates(db: Session, job_id: str, now: Optional[datetime] = None):
     """
     Update job-level aggregate metrics from steps.
     Called when job completes or fails.
@@ -144,40 +213,66 @@ async def update_job_aggregates(db: Session, job_id: str):
     if not job:
         return
 
-    # Get all completed steps
-    steps = db.query(JobStep).filter(JobStep.job_id == job_id).all()
-
-    # Aggregate token usage and cost
-    total_tokens = sum(s.total_tokens or 0 for s in steps)
-    total_cost = sum(float(s.api_cost_usd or 0) for s in steps)
+    # Aggregate token usage, cost and LID language in a single round-trip
+    total_tokens, total_cost, lid_language = (
+        db.query(
+            func.coalesce(func.sum(JobStep.total_tokens), 0),
+            func.coalesce(func.sum(JobStep.api_cost_usd), 0),
+            func.max(case((JobStep.step_name == "LID", JobStep.detected_language))),
+        )
+        .filter(JobStep.job_id == job_id)
+        .one()
+    )
 
     job.total_tokens_used = total_tokens
     job.total_cost_usd = total_cost
-    job.completed_at = _now_utc()
+    job.completed_at = now or _now_utc()
 
     # Set source language from LID step if detected
-    lid_step = next((s for s in steps if s.step_name == "LID" and s.detected_language), None)
-    if lid_step:
-        job.source_language = lid_step.detected_language
+    if lid_language:
+        job.source_language = lid_language
 
     db.commit()
 
 
-async def dispatch_to_queue(sender, queue_name, message_body):
-    """Dispatch message with queue timestamp for latency tracking"""
-    message_body["queued_at"] = _now_utc().isoformat()
-    message = ServiceBusMessage(json.dumps(message_body))
+async def dispatch_to_queue(sender, queue_name, message_body, delay_s: float = 0):
+    """Dispatch message with queue timestamp for latency tracking.
+
+    Callers create the step row before dispatching so the worker's completion
+    event always finds it; each transition issues a single dispatch.
+    A positive delay_s schedules the message for later delivery (used for retries).
+    """
+    queued_at = _now_utc() + timedelta(seconds=delay_s)
+    message_body["queued_at"] = queued_at.isoformat()
+    # Integer epoch ns lets workers compute queue wait without parsing the ISO timestamp
+    message_body["queued_at_ns"] = round(queued_at.timestamp() * 1_000_000_000)
+    message = ServiceBusMessage(orjson.dumps(message_body))
+    if delay_s > 0:
+        message.scheduled_enqueue_time_utc = queued_at
     await sender.get_queue_sender(queue_name).send_messages(message)
-    print(f"Dispatched to {queue_name}: {message_body.get('job_id')}")
+    logger.debug("Dispatched to %s: %s", queue_name, message_body.get("job_id"))
+
+
+async def dispatch_transcribe(sender, job_id, language, delay_s: float = 0):
+    """Route a transcription step: English goes to Azure AI, other languages to Whisper"""
+    if language == "en":
+        payload = {"job_id": job_id, "task": "transcribe", "language": "en"}
+        await dispatch_to_queue(sender, QUEUE_AZURE, payload, delay_s=delay_s)
+    else:
+        await dispatch_to_queue(sender, QUEUE_WHISPER, {"job_id": job_id, "language": language}, delay_s=delay_s)
 
 
 async def send_callback(job):
-    """Send webhook callback on job completion/failure"""
+    """Send webhook callback on job completion/failure.
+
+    Must be awaited after update_job_aggregates: the payload reports the
+    aggregated totals and completion time, so the two are not run concurrently.
+    """
     callback_url = job.callback_url or (job.metadata_ and job.metadata_.get("callback_url"))
     if not callback_url:
         return
 
-    print(f"Sending callback to {callback_url} for Job {job.job_id}")
+    logger.info("Sending callback to %s for Job %s", callback_url, job.job_id)
     payload = {
         "job_id": str(job.job_id),
         "status": job.status,
@@ -188,13 +283,12 @@ async def send_callback(job):
     }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(callback_url, json=payload, timeout=10.0)
-            # Update callback status
-            job.callback_sent_at = _now_utc()
-            job.callback_status = "success" if response.status_code < 400 else "failed"
+        response = await _get_http_client().post(callback_url, json=payload)
+        # Update callback status
+        job.callback_sent_at = _now_utc()
+        job.callback_status = "success" if response.status_code < 400 else "failed"
     except Exception as e:
-        print(f"Failed to send callback: {e}")
+        logger.warning("Failed to send callback: %s", e)
         job.callback_status = "failed"
 
 
@@ -206,65 +300,60 @@ async def process_router_message(msg_content, sb_client):
         metrics = msg_content.get("metrics", {})
         result = msg_content.get("result", {})
 
-        print(f"Processing event: {event_type} for Job {job_id}")
+        logger.debug("Processing event: %s for Job %s", event_type, job_id)
+
+        # One timestamp per message for all DB bookkeeping below
+        now = _now_utc()
 
         job = await get_job(db, job_id)
         if not job:
-            print(f"Job {job_id} not found")
+            logger.warning("Job %s not found", job_id)
             return
 
         sender = sb_client
 
         if event_type == "JOB_STARTED":
             job.status = "PROCESSING"
-            job.started_at = _now_utc()
-            job.queued_at = _now_utc()
+            job.started_at = now
+            job.queued_at = now
             db.commit()
 
             # Initial Step: Always LID for full_pipeline
             if job.workflow_type == "full_pipeline" or job.workflow_type == "lid_only":
-                await create_step(db, job_id, "LID")
+                await create_step(db, job_id, "LID", now=now)
                 await dispatch_to_queue(sender, QUEUE_LID, {"job_id": job_id})
 
             elif job.workflow_type == "transcribe_only":
                 lang = job.source_language or (job.metadata_ and job.metadata_.get("language")) or "en"
-                await create_step(db, job_id, "TRANSCRIBE")
+                await create_step(db, job_id, "TRANSCRIBE", now=now)
 
-                if lang == "en":
-                    await dispatch_to_queue(
-                        sender, QUEUE_AZURE, {"job_id": job_id, "task": "transcribe", "language": "en"}
-                    )
-                else:
-                    await dispatch_to_queue(sender, QUEUE_WHISPER, {"job_id": job_id, "language": lang})
+                await dispatch_transcribe(sender, job_id, lang)
 
         elif event_type == "STEP_COMPLETED":
             step_name = msg_content.get("step_name")
 
             # Update step with all metrics
-            await update_step_with_metrics(db, job_id, step_name, "COMPLETED", result=result, metrics=metrics)
+            await update_step_with_metrics(
+                db, job_id, step_name, "COMPLETED", result=result, metrics=metrics, now=now
+            )
 
             if step_name == "LID":
                 detected_lang = result.get("language")
                 confidence = result.get("confidence", 0)
-                print(f"LID Detected: {detected_lang} (confidence: {confidence})")
+                logger.info("LID Detected: %s (confidence: %s)", detected_lang, confidence)
 
                 if job.workflow_type == "lid_only":
                     job.status = "COMPLETED"
-                    await update_job_aggregates(db, job_id)
+                    await update_job_aggregates(db, job_id, now=now)
                     await send_callback(job)
                     return
 
-                await create_step(db, job_id, "TRANSCRIBE")
+                await create_step(db, job_id, "TRANSCRIBE", now=now)
 
-                if detected_lang == "en":
-                    await dispatch_to_queue(
-                        sender, QUEUE_AZURE, {"job_id": job_id, "task": "transcribe", "language": "en"}
-                    )
-                else:
-                    await dispatch_to_queue(sender, QUEUE_WHISPER, {"job_id": job_id, "language": detected_lang})
+                await dispatch_transcribe(sender, job_id, detected_lang)
 
             elif step_name == "TRANSCRIBE":
-                await create_step(db, job_id, "SUMMARIZE")
+                await create_step(db, job_id, "SUMMARIZE", now=now)
                 transcript_text = result.get("text_preview", "")
                 await dispatch_to_queue(
                     sender, QUEUE_AZURE, {"job_id": job_id, "task": "summarize", "text": transcript_text}
@@ -272,14 +361,14 @@ async def process_router_message(msg_content, sb_client):
 
             elif step_name == "SUMMARIZE" or step_name == "TRANSLATE":
                 job.status = "COMPLETED"
-                await update_job_aggregates(db, job_id)
-                print(f"Job {job_id} COMPLETED")
+                await update_job_aggregates(db, job_id, now=now)
+                logger.info("Job %s COMPLETED", job_id)
                 await send_callback(job)
 
         elif event_type == "STEP_FAILED":
             step_name = msg_content.get("step_name")
             error_msg = msg_content.get("error")
-            print(f"Step {step_name} FAILED: {error_msg}")
+            logger.warning("Step %s FAILED: %s", step_name, error_msg)
 
             step = await get_latest_step(db, job_id, step_name)
 
@@ -287,7 +376,11 @@ async def process_router_message(msg_content, sb_client):
             if step and step.retry_count < MAX_RETRIES:
                 step.retry_count += 1
                 step.status = "QUEUED"
-                step.queued_at = _now_utc()  # Reset queue time for retry
+
+                # Spread retries over time so a struggling worker pool is not hit all at once;
+                # brokers without scheduled delivery (local RabbitMQ) retry immediately
+                delay_s = _retry_delay_seconds(step.retry_count) if _supports_scheduled_delivery(sender) else 0
+                step.queued_at = now + timedelta(seconds=delay_s)  # Reset queue time for retry
 
                 # Store error info from failed attempt
                 if metrics:
@@ -295,11 +388,13 @@ async def process_router_message(msg_content, sb_client):
                     step.processing_duration_ms = metrics.get("processing_duration_ms")
 
                 db.commit()
-                print(f"Retrying step {step_name} (Attempt {step.retry_count}/{MAX_RETRIES})")
+                logger.info(
+                    "Retrying step %s (Attempt %d/%d) in %.1fs", step_name, step.retry_count, MAX_RETRIES, delay_s
+                )
 
                 # Re-dispatch based on step name
                 if step_name == "LID":
-                    await dispatch_to_queue(sender, QUEUE_LID, {"job_id": job_id})
+                    await dispatch_to_queue(sender, QUEUE_LID, {"job_id": job_id}, delay_s=delay_s)
 
                 elif step_name == "TRANSCRIBE":
                     # Get language from LID result or job metadata
@@ -312,19 +407,17 @@ async def process_router_message(msg_content, sb_client):
                     elif job.metadata_ and job.metadata_.get("language"):
                         lang = job.metadata_.get("language")
 
-                    if lang == "en":
-                        await dispatch_to_queue(
-                            sender, QUEUE_AZURE, {"job_id": job_id, "task": "transcribe", "language": "en"}
-                        )
-                    else:
-                        await dispatch_to_queue(sender, QUEUE_WHISPER, {"job_id": job_id, "language": lang})
+                    await dispatch_transcribe(sender, job_id, lang, delay_s=delay_s)
 
                 elif step_name == "SUMMARIZE":
                     transcribe_step = await get_latest_step(db, job_id, "TRANSCRIBE")
                     if transcribe_step and transcribe_step.result_payload:
                         text_preview = transcribe_step.result_payload.get("text_preview", "")
                         await dispatch_to_queue(
-                            sender, QUEUE_AZURE, {"job_id": job_id, "task": "summarize", "text": text_preview}
+                            sender,
+                            QUEUE_AZURE,
+                            {"job_id": job_id, "task": "summarize", "text": text_preview},
+                            delay_s=delay_s,
                         )
                     else:
                         await update_step_with_metrics(
@@ -334,26 +427,39 @@ async def process_router_message(msg_content, sb_client):
                             "FAILED",
                             error="Cannot retry: missing transcript data",
                             metrics=metrics,
+                            now=now,
                         )
                         job.status = "FAILED"
-                        await update_job_aggregates(db, job_id)
+                        await update_job_aggregates(db, job_id, now=now)
                         await send_callback(job)
 
             else:
                 # Max retries exceeded
-                await update_step_with_metrics(db, job_id, step_name, "FAILED", error=error_msg, metrics=metrics)
+                await update_step_with_metrics(
+                    db, job_id, step_name, "FAILED", error=error_msg, metrics=metrics, now=now
+                )
                 job.status = "FAILED"
-                await update_job_aggregates(db, job_id)
+                await update_job_aggregates(db, job_id, now=now)
                 await send_callback(job)
 
     except Exception as e:
-        print(f"Error processing message: {e}")
+        logger.exception("Error processing message: %s", e)
     finally:
         db.close()
 
 
 async def main():
-    print("Starting Router Service...")
+    log_listener = configure_queue_logging("router")
+    logger.info("Starting Router Service...")
+    http_client = _get_http_client()
+    try:
+        await _consume()
+    finally:
+        await http_client.aclose()
+        log_listener.stop()
+
+
+async def _consume():
     conn_str = settings.SERVICEBUS_CONNECTION_STRING if settings.ENVIRONMENT == "AZURE" else settings.RABBITMQ_URL
     queue_name = settings.ROUTER_QUEUE_NAME
 
@@ -362,9 +468,9 @@ async def main():
         async with get_message_broker(connection_string=conn_str) as client:
             receiver = await client.get_queue_receiver(queue_name=queue_name)
             async with receiver:
-                print(f"Listening on {queue_name}...")
+                logger.info("Listening on %s...", queue_name)
                 async for msg in receiver:
-                    body = json.loads(str(msg))
+                    body = _decode_message(msg)
                     await process_router_message(body, client)
                     await receiver.complete_message(msg)
     else:
@@ -373,9 +479,9 @@ async def main():
         async with ServiceBusClient.from_connection_string(conn_str) as client:
             receiver = client.get_queue_receiver(queue_name=queue_name)
             async with receiver:
-                print(f"Listening on {queue_name}...")
+                logger.info("Listening on %s...", queue_name)
                 async for msg in receiver:
-                    body = json.loads(str(msg))
+                    body = _decode_message(msg)
                     await process_router_message(body, client)
                     await receiver.complete_message(msg)
 
@@ -5,10 +5,24 @@ This module provides a unified interface for storage operations that works with:
 - Local filesystem (for development)
 """
 
+import asyncio
 import os
+import shutil
+import stat
+import threading
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterable, Optional, Tuple
+
+# Upload SAS lifetime and user delegation key caching
+UPLOAD_SAS_LIFETIME = timedelta(hours=1)
+DELEGATION_KEY_LIFETIME = timedelta(hours=24)
+DELEGATION_KEY_REFRESH_MARGIN = timedelta(minutes=10)
+
+# Chunk size for local filesystem stream copies (default io buffer is 8 KiB)
+LOCAL_IO_BUFFER_SIZE = 1024 * 1024
 
 
 class StorageAdapter(ABC):
@@ -39,6 +53,69 @@ class StorageAdapter(ABC):
         """
         pass
 
+    def upload_stream(
+        self,
+        container_name: str,
+        blob_name: str,
+        stream: BinaryIO,
+        length: Optional[int] = None,
+        overwrite: bool = True,
+    ) -> None:
+        """Upload data from a readable binary stream.
+
+        Args:
+            container_name: Name of the container/directory
+            blob_name: Name of the blob/file
+            stream: Readable binary file-like object
+            length: Number of bytes to upload, if known
+            overwrite: Whether to overwrite existing data
+        """
+        self.upload_blob(container_name, blob_name, stream.read(), overwrite=overwrite)
+
+    def download_to_stream(self, container_name: str, blob_name: str, stream: BinaryIO) -> int:
+        """Download a blob into a writable binary stream.
+
+        Args:
+            container_name: Name of the container/directory
+            blob_name: Name of the blob/file
+            stream: Writable binary file-like object
+
+        Returns:
+            Number of bytes written
+        """
+        data = self.download_blob(container_name, blob_name)
+        stream.write(data)
+        return len(data)
+
+    def upload_blob_from_path(
+        self, container_name: str, blob_name: str, file_path: str, overwrite: bool = True
+    ) -> None:
+        """Upload a local file to storage.
+
+        Args:
+            container_name: Name of the container/directory
+            blob_name: Name of the blob/file
+            file_path: Path of the local file to upload
+            overwrite: Whether to overwrite existing data
+        """
+        with open(file_path, "rb") as f:
+            length = os.fstat(f.fileno()).st_size
+            self.upload_stream(container_name, blob_name, f, length=length, overwrite=overwrite)
+
+    def download_blob_to_path(self, container_name: str, blob_name: str, file_path: str) -> int:
+        """Download a blob into a local file.
+
+        Args:
+            container_name: Name of the container/directory
+            blob_name: Name of the blob/file
+            file_path: Local path where the file should be saved
+
+        Returns:
+            Size of the downloaded file in bytes
+        """
+        with open(file_path, "wb") as f:
+            return self.download_to_stream(container_name, blob_name, f)
+
     @abstractmethod
     def blob_exists(self, container_name: str, blob_name: str) -> bool:
         """Check if blob exists.
@@ -74,6 +151,48 @@ class StorageAdapter(ABC):
         """
         pass
 
+    def generate_upload_urls(self, container_name: str, blob_names: Iterable[str]) -> Dict[str, str]:
+        """Generate upload URLs for several blobs in one container (e.g. all blobs of a job).
+
+        Args:
+            container_name: Name of the container/directory
+            blob_names: Names of the blobs/files
+
+        Returns:
+            Mapping of blob name to URL or path for uploading
+        """
+        return {blob_name: self.generate_upload_url(container_name, blob_name) for blob_name in blob_names}
+
+    # Async variants: run the blocking IO in a worker thread so callers on an
+    # event loop (API handlers, async workers) are not stalled by disk/network IO.
+
+    async def aupload_blob(self, container_name: str, blob_name: str, data: bytes, overwrite: bool = True) -> None:
+        """Async variant of upload_blob."""
+        await asyncio.to_thread(self.upload_blob, container_name, blob_name, data, overwrite)
+
+    async def aupload_stream(
+        self,
+        container_name: str,
+        blob_name: str,
+        stream: BinaryIO,
+        length: Optional[int] = None,
+        overwrite: bool = True,
+    ) -> None:
+        """Async variant of upload_stream."""
+        await asyncio.to_thread(self.upload_stream, container_name, blob_name, stream, length, overwrite)
+
+    async def adownload_blob(self, container_name: str, blob_name: str) -> bytes:
+        """Async variant of download_blob."""
+        return await asyncio.to_thread(self.download_blob, container_name, blob_name)
+
+    async def ablob_exists(self, container_name: str, blob_name: str) -> bool:
+        """Async variant of blob_exists."""
+        return await asyncio.to_thread(self.blob_exists, container_name, blob_name)
+
+    async def agenerate_upload_url(self, container_name: str, blob_name: str) -> str:
+        """Async variant of generate_upload_url."""
+        return await asyncio.to_thread(self.generate_upload_url, container_name, blob_name)
+
 
 class AzureBlobStorageAdapter(StorageAdapter):
     """Azure Blob Storage implementation using DefaultAzureCredential."""
@@ -96,78 +215,173 @@ class AzureBlobStorageAdapter(StorageAdapter):
         self.account_url = account_url
         self.use_connection_string = use_connection_string
 
+        # Large transfers are split into chunks moved in parallel
+        chunk_size = int(os.getenv("BLOB_CHUNK_SIZE_MB", "4")) * 1024 * 1024
+        self.max_concurrency = int(os.getenv("BLOB_MAX_CONCURRENCY", "8"))
+        client_options = {
+            "transport": self._build_transport(),
+            "max_block_size": chunk_size,
+            "max_single_put_size": chunk_size,
+            "max_chunk_get_size": chunk_size,
+        }
+
         if use_connection_string and connection_string:
             # Use connection string (for Azurite local development)
-            self.client = BlobServiceClient.from_connection_string(connection_string)
+            self.client = BlobServiceClient.from_connection_string(connection_string, **client_options)
         else:
             # Use DefaultAzureCredential (production)
             from azure.identity import DefaultAzureCredential
 
             credential = DefaultAzureCredential()
-            self.client = BlobServiceClient(account_url=account_url, credential=credential)
+            self.client = BlobServiceClient(account_url=account_url, credential=credential, **client_options)
+
+        # Container clients share the service client's pipeline; cache them per container
+        self._containers = {}
+        self._known_containers = set()  # Containers confirmed to exist; skips repeat HEAD requests
+
+        # Invariant parts of upload SAS URLs, computed once rather than per URL
+        from azure.storage.blob import BlobSasPermissions
+
+        self._upload_permission = BlobSasPermissions(write=True, create=True)
+        if not use_connection_string:
+            self._upload_base_url = (self.account_url or "").rstrip("/")
+        elif self.client.account_name == "devstoreaccount1":
+            # For Azurite, use container hostname for container-to-container communication
+            self._upload_base_url = "http://speechflow-azurite:10000/devstoreaccount1"
+        else:
+            self._upload_base_url = self.client.url.rstrip("/")
+
+        # User delegation key cache (production SAS); refreshed shortly before it expires
+        self._delegation_key = None
+        self._delegation_key_expiry: Optional[datetime] = None
+        self._delegation_key_lock = threading.Lock()
+
+    @staticmethod
+    def _build_transport():
+        """Build an HTTP transport with a connection pool sized for concurrent workers.
+
+        Returns:
+            RequestsTransport backed by a pooled requests.Session
+        """
+        import requests
+        from azure.core.pipeline.transport import RequestsTransport
+        from requests.adapters import HTTPAdapter
+
+        pool_size = int(os.getenv("BLOB_HTTP_POOL_SIZE", "64"))
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return RequestsTransport(session=session, connection_timeout=20, read_timeout=120)
+
+    def _container_client(self, container_name: str):
+        """Get a cached ContainerClient for a container."""
+        container_client = self._containers.get(container_name)
+        if container_client is None:
+            container_client = self._containers[container_name] = self.client.get_container_client(container_name)
+        return container_client
 
     def upload_blob(self, container_name: str, blob_name: str, data: bytes, overwrite: bool = True) -> None:
         """Upload data to Azure Blob Storage."""
-        blob_client = self.client.get_blob_client(container=container_name, blob=blob_name)
+        blob_client = self._container_client(container_name).get_blob_client(blob_name)
         blob_client.upload_blob(data, overwrite=overwrite)
 
     def download_blob(self, container_name: str, blob_name: str) -> bytes:
         """Download data from Azure Blob Storage."""
-        blob_client = self.client.get_blob_client(container=container_name, blob=blob_name)
+        blob_client = self._container_client(container_name).get_blob_client(blob_name)
         return blob_client.download_blob().readall()
 
+    def upload_stream(
+        self,
+        container_name: str,
+        blob_name: str,
+        stream: BinaryIO,
+        length: Optional[int] = None,
+        overwrite: bool = True,
+    ) -> None:
+        """Upload a stream to Azure Blob Storage in parallel chunks."""
+        blob_client = self._container_client(container_name).get_blob_client(blob_name)
+        blob_client.upload_blob(stream, length=length, overwrite=overwrite, max_concurrency=self.max_concurrency)
+
+    def download_to_stream(self, container_name: str, blob_name: str, stream: BinaryIO) -> int:
+        """Download a blob from Azure Blob Storage into a stream in parallel chunks."""
+        blob_client = self._container_client(container_name).get_blob_client(blob_name)
+        return blob_client.download_blob(max_concurrency=self.max_concurrency).readinto(stream)
+
     def blob_exists(self, container_name: str, blob_name: str) -> bool:
         """Check if blob exists in Azure."""
-        blob_client = self.client.get_blob_client(container=container_name, blob=blob_name)
+        blob_client = self._container_client(container_name).get_blob_client(blob_name)
         return blob_client.exists()
 
     def ensure_container(self, container_name: str) -> None:
         """Ensure container exists in Azure."""
-        container_client = self.client.get_container_client(container_name)
+        if container_name in self._known_containers:
+            return
+
+        container_client = self._container_client(container_name)
         if not container_client.exists():
             container_client.create_container()
+        self._known_containers.add(container_name)
+
+    def _get_delegation_key(self, now: datetime):
+        """Get a cached user delegation key, fetching a new one near expiry.
+
+        Args:
+            now: Current UTC time (naive, as used for SAS times)
+
+        Returns:
+            UserDelegationKey valid for at least one upload SAS lifetime
+        """
+        # Key must outlive any SAS signed with it, plus a safety margin
+        min_remaining = UPLOAD_SAS_LIFETIME + DELEGATION_KEY_REFRESH_MARGIN
+        with self._delegation_key_lock:
+            if self._delegation_key is None or self._delegation_key_expiry - now < min_remaining:
+                expiry = now + DELEGATION_KEY_LIFETIME
+                self._delegation_key = self.client.get_user_delegation_key(key_start_time=now, key_expiry_time=expiry)
+                self._delegation_key_expiry = expiry
+            return self._delegation_key
 
     def generate_upload_url(self, container_name: str, blob_name: str) -> str:
         """Generate SAS URL for uploading."""
-        if self.use_connection_string:
-            # For Azurite, generate SAS with connection string
-            from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+        return self.generate_upload_urls(container_name, (blob_name,))[blob_name]
 
-            sas_token = generate_blob_sas(
-                account_name=self.client.account_name,
-                container_name=container_name,
-                blob_name=blob_name,
-                account_key=self.client.credential.account_key,
-                permission=BlobSasPermissions(write=True, create=True),
-                expiry=datetime.utcnow() + timedelta(hours=1),
-            )
+    def generate_upload_urls(self, container_name: str, blob_names: Iterable[str]) -> Dict[str, str]:
+        """Generate SAS URLs for uploading several blobs with one set of signing inputs.
 
-            # For Azurite, use container hostname for container-to-container communication
-            if self.client.account_name == "devstoreaccount1":
-                base_url = "http://speechflow-azurite:10000/devstoreaccount1"
-            else:
-                base_url = self.client.url.rstrip("/")
+        Expiry, permission and the signing credential (account key or user delegation
+        key) are resolved once; only the blob name varies per signature.
+
+        Args:
+            container_name: Name of the container
+            blob_names: Names of the blobs
+
+        Returns:
+            Mapping of blob name to SAS upload URL
+        """
+        from azure.storage.blob import generate_blob_sas
 
-            return f"{base_url}/{container_name}/{blob_name}?{sas_token}"
+        now = datetime.utcnow()
+
+        if self.use_connection_string:
+            # For Azurite, generate SAS with connection string
+            credential = {"account_key": self.client.credential.account_key}
         else:
             # For production with DefaultAzureCredential, generate user delegation SAS
-            from azure.storage.blob import BlobSasPermissions, UserDelegationKey, generate_blob_sas
-
-            # Get user delegation key
-            delegation_key = self.client.get_user_delegation_key(
-                key_start_time=datetime.utcnow(), key_expiry_time=datetime.utcnow() + timedelta(hours=1)
-            )
+            credential = {"user_delegation_key": self._get_delegation_key(now)}
 
-            sas_token = generate_blob_sas(
-                account_name=self.client.account_name,
-                container_name=container_name,
-                blob_name=blob_name,
-                user_delegation_key=delegation_key,
-                permission=BlobSasPermissions(write=True, create=True),
-                expiry=datetime.utcnow() + timedelta(hours=1),
-            )
+        sas_args = dict(
+            credential,
+            account_name=self.client.account_name,
+            container_name=container_name,
+            permission=self._upload_permission,
+            expiry=now + UPLOAD_SAS_LIFETIME,
+        )
+        container_url = f"{self._upload_base_url}/{container_name}"
 
-            return f"{self.account_url}/{container_name}/{blob_name}?{sas_token}"
+        return {
+            blob_name: f"{container_url}/{blob_name}?{generate_blob_sas(blob_name=blob_name, **sas_args)}"
+            for blob_name in blob_names
+        }
 
 
 class LocalFileStorageAdapter(StorageAdapter):
@@ -180,10 +394,33 @@ class LocalFileStorageAdapter(StorageAdapter):
             base_path: Base directory for local storage
         """
         self.base_path = base_path
-        os.makedirs(base_path, exist_ok=True)
+        self._ensured_dirs = set()  # Directories already created by this adapter
+        self._ensure_dir(base_path)
+
+    def _ensure_dir(self, path: str) -> None:
+        """Create a directory once per adapter instead of on every call.
+
+        Args:
+            path: Directory path to create
+        """
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+
+    def _blob_path(self, container_name: str, blob_name: str) -> str:
+        """Get full file path for a blob without touching the filesystem.
+
+        Args:
+            container_name: Container directory name
+            blob_name: Blob file name
+
+        Returns:
+            Full file path
+        """
+        return os.path.join(self.base_path, container_name, blob_name)
 
     def _get_blob_path(self, container_name: str, blob_name: str) -> str:
-        """Get full file path for a blob.
+        """Get full file path for a blob, creating its parent directories (for writes).
 
         Args:
             container_name: Container directory name
@@ -192,17 +429,14 @@ class LocalFileStorageAdapter(StorageAdapter):
         Returns:
             Full file path
         """
-        container_path = os.path.join(self.base_path, container_name)
-        os.makedirs(container_path, exist_ok=True)
-        return os.path.join(container_path, blob_name)
+        blob_path = self._blob_path(container_name, blob_name)
+        self._ensure_dir(os.path.dirname(blob_path))
+        return blob_path
 
     def upload_blob(self, container_name: str, blob_name: str, data: bytes, overwrite: bool = True) -> None:
         """Upload data to local filesystem."""
         blob_path = self._get_blob_path(container_name, blob_name)
 
-        # Create parent directories if they don't exist
-        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
-
         # Write file
         mode = "wb" if overwrite else "xb"
         with open(blob_path, mode) as f:
@@ -210,19 +444,94 @@ class LocalFileStorageAdapter(StorageAdapter):
 
     def download_blob(self, container_name: str, blob_name: str) -> bytes:
         """Download data from local filesystem."""
+        blob_path = self._blob_path(container_name, blob_name)
+        # Unbuffered read sizes the result from fstat and fills it in one pass
+        with open(blob_path, "rb", buffering=0) as f:
+            return f.readall()
+
+    def upload_stream(
+        self,
+        container_name: str,
+        blob_name: str,
+        stream: BinaryIO,
+        length: Optional[int] = None,
+        overwrite: bool = True,
+    ) -> None:
+        """Copy a stream to the local filesystem without buffering it whole."""
         blob_path = self._get_blob_path(container_name, blob_name)
-        with open(blob_path, "rb") as f:
-            return f.read()
+        mode = "wb" if overwrite else "xb"
+        with open(blob_path, mode, buffering=0) as f:
+            if not self._sendfile(stream, f):
+                shutil.copyfileobj(stream, f, LOCAL_IO_BUFFER_SIZE)
+
+    @staticmethod
+    def _sendfile(src: BinaryIO, dst: BinaryIO) -> bool:
+        """Copy the rest of a regular file into dst in kernel space.
+
+        Args:
+            src: Source stream, copied from its current position
+            dst: Destination file opened for writing
+
+        Returns:
+            False without copying anything if src is not backed by a regular file
+            (e.g. BytesIO) or the platform lacks sendfile
+        """
+        if not hasattr(os, "sendfile"):
+            return False
+        try:
+            in_fd = src.fileno()
+        except (AttributeError, OSError):
+            return False
+        file_stat = os.fstat(in_fd)
+        if not stat.S_ISREG(file_stat.st_mode):
+            return False
+
+        # tell() accounts for read-ahead in buffered readers; sendfile does not move the fd offset
+        offset = src.tell()
+        out_fd = dst.fileno()
+        while offset < file_stat.st_size:
+            sent = os.sendfile(out_fd, in_fd, offset, file_stat.st_size - offset)
+            if sent == 0:
+                break
+            offset += sent
+        src.seek(offset)
+        return True
+
+    def download_to_stream(self, container_name: str, blob_name: str, stream: BinaryIO) -> int:
+        """Copy a stored file into a stream without buffering it whole."""
+        buffer = bytearray(LOCAL_IO_BUFFER_SIZE)
+        view = memoryview(buffer)
+        total = 0
+        with open(self._blob_path(container_name, blob_name), "rb", buffering=0) as f:
+            # readinto reuses one buffer instead of allocating a bytes object per chunk
+            while size := f.readinto(buffer):
+                stream.write(view[:size])
+                total += size
+        return total
+
+    def upload_blob_from_path(
+        self, container_name: str, blob_name: str, file_path: str, overwrite: bool = True
+    ) -> None:
+        """Copy a local file into storage (kernel-side copy via sendfile where available)."""
+        blob_path = self._get_blob_path(container_name, blob_name)
+
+        if not overwrite and os.path.exists(blob_path):
+            raise FileExistsError(blob_path)
+        shutil.copyfile(file_path, blob_path)
+
+    def download_blob_to_path(self, container_name: str, blob_name: str, file_path: str) -> int:
+        """Copy a stored file to a local path (kernel-side copy via sendfile where available)."""
+        blob_path = self._blob_path(container_name, blob_name)
+        shutil.copyfile(blob_path, file_path)
+        return os.path.getsize(file_path)
 
     def blob_exists(self, container_name: str, blob_name: str) -> bool:
         """Check if file exists."""
-        blob_path = self._get_blob_path(container_name, blob_name)
-        return os.path.exists(blob_path)
+        return os.path.exists(self._blob_path(container_name, blob_name))
 
     def ensure_container(self, container_name: str) -> None:
         """Ensure directory exists."""
-        container_path = os.path.join(self.base_path, container_name)
-        os.makedirs(container_path, exist_ok=True)
+        self._ensure_dir(os.path.join(self.base_path, container_name))
 
     def generate_upload_url(self, container_name: str, blob_name: str) -> str:
         """Generate file path for uploading (local mode).
@@ -235,14 +544,51 @@ class LocalFileStorageAdapter(StorageAdapter):
             File path URL
         """
         blob_path = self._get_blob_path(container_name, blob_name)
-        # Create parent directories
-        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
         return f"file://{blob_path}"
 
 
+# Environment variables that influence adapter selection; part of the cache key
+_ADAPTER_ENV_VARS = (
+    "ENVIRONMENT",
+    "USE_CLOUD_RESOURCES",
+    "AZURE_STORAGE_CONNECTION_STRING",
+    "LOCAL_STORAGE_PATH",
+    "AZURE_CLIENT_ID",
+    "AZURE_CLIENT_SECRET",
+    "AZURE_TENANT_ID",
+    "AZURE_STORAGE_ACCOUNT_URL",
+    "AZURE_STORAGE_ACCOUNT_NAME",
+)
+
+
+@dataclass(frozen=True)
+class StorageConfig:
+    """Resolved storage adapter selection.
+
+    Attributes:
+        backend: "local", "connection_string" or "account_url"
+        local_path: Base directory for the local filesystem adapter
+        connection_string: Connection string for Azurite or key-based Azure access
+        account_url: Account URL for DefaultAzureCredential access
+    """
+
+    backend: str
+    local_path: Optional[str] = None
+    connection_string: Optional[str] = None
+    account_url: Optional[str] = None
+
+
+# Adapter instances shared process-wide so clients and connection pools are reused
+_adapters: Dict[StorageConfig, StorageAdapter] = {}
+_adapters_lock = threading.Lock()
+
+
 def get_storage_adapter(account_url: Optional[str] = None, connection_string: Optional[str] = None) -> StorageAdapter:
     """Factory function to get the appropriate storage adapter.
 
+    Adapters are cached per resolved configuration, so repeated calls return the
+    same instance (and the same underlying BlobServiceClient).
+
     Args:
         account_url: Azure Storage account URL (for AZURE mode)
         connection_string: Connection string (for Azurite development)
@@ -250,51 +596,91 @@ def get_storage_adapter(account_url: Optional[str] = None, connection_string: Op
     Returns:
         StorageAdapter instance (either Azure Blob Storage or local filesystem)
     """
-    environment = os.getenv("ENVIRONMENT", "AZURE").upper()
-    use_cloud_resources = os.getenv("USE_CLOUD_RESOURCES", "false").lower() == "true"
+    env = tuple(os.getenv(name) for name in _ADAPTER_ENV_VARS)
+    config = resolve_storage_config(account_url, connection_string, env)
+    adapter = _adapters.get(config)
+    if adapter is None:
+        # Concurrent first calls (e.g. from to_thread) must not build duplicate clients and pools
+        with _adapters_lock:
+            adapter = _adapters.get(config)
+            if adapter is None:
+                adapter = _adapters[config] = _create_storage_adapter(config)
+    return adapter
+
+
+@lru_cache(maxsize=32)
+def resolve_storage_config(
+    account_url: Optional[str], connection_string: Optional[str], env: Tuple[Optional[str], ...]
+) -> StorageConfig:
+    """Parse adapter selection settings once per distinct environment.
+
+    Args:
+        account_url: Azure Storage account URL passed by the caller
+        connection_string: Connection string passed by the caller
+        env: Values of _ADAPTER_ENV_VARS, in order
+
+    Returns:
+        StorageConfig describing which adapter to build
+    """
+    values = dict(zip(_ADAPTER_ENV_VARS, env))
+
+    def getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+        value = values.get(name)
+        return default if value is None else value
+
+    environment = getenv("ENVIRONMENT", "AZURE").upper()
+    use_cloud_resources = getenv("USE_CLOUD_RESOURCES", "false").lower() == "true"
 
     # Check if connection string provided
     if connection_string is None:
-        connection_string = os.getenv("AZURE_STORAGE_CONNECTION_STRING", "")
+        connection_string = getenv("AZURE_STORAGE_CONNECTION_STRING", "")
 
     # Check if this is Azurite (connection string with devstoreaccount1)
     use_azurite = "devstoreaccount1" in connection_string or "BlobEndpoint=http://" in connection_string
 
     if environment == "LOCAL" and not use_azurite and not use_cloud_resources:
         # Use local filesystem for local development (no Azurite, no Cloud Resources)
-        base_path = os.getenv("LOCAL_STORAGE_PATH", "/tmp/speech-flow-storage")
-        return LocalFileStorageAdapter(base_path)
+        return StorageConfig("local", local_path=getenv("LOCAL_STORAGE_PATH", "/tmp/speech-flow-storage"))
     elif use_azurite:
         # Use Azurite with connection string (LOCAL mode with Azurite)
-        return AzureBlobStorageAdapter(use_connection_string=True, connection_string=connection_string)
+        return StorageConfig("connection_string", connection_string=connection_string)
     else:
         # Production OR Hybrid: Use Azure Blob Storage
         
         # Check if we should use Service Principal (Client ID/Secret/Tenant)
         # This is preferred over connection strings for Hybrid/Production if available
-        client_id = os.getenv("AZURE_CLIENT_ID")
-        client_secret = os.getenv("AZURE_CLIENT_SECRET")
-        tenant_id = os.getenv("AZURE_TENANT_ID")
+        client_id = getenv("AZURE_CLIENT_ID")
+        client_secret = getenv("AZURE_CLIENT_SECRET")
+        tenant_id = getenv("AZURE_TENANT_ID")
         
         if client_id and client_secret and tenant_id:
              # Use DefaultAzureCredential (which picks up these env vars)
             if account_url is None:
-                account_url = os.getenv("AZURE_STORAGE_ACCOUNT_URL", "")
+                account_url = getenv("AZURE_STORAGE_ACCOUNT_URL", "")
                 if not account_url:
                     # Try to construct from account name
-                    name = os.getenv("AZURE_STORAGE_ACCOUNT_NAME")
+                    name = getenv("AZURE_STORAGE_ACCOUNT_NAME")
                     if name:
                         account_url = f"https://{name}.blob.core.windows.net"
                     else:
                         raise ValueError("AZURE_STORAGE_ACCOUNT_URL or AZURE_STORAGE_ACCOUNT_NAME must be set when using Service Principal authentication")
             
-            return AzureBlobStorageAdapter(account_url=account_url, use_connection_string=False)
+            return StorageConfig("account_url", account_url=account_url)
 
         # If USE_CLOUD_RESOURCES is True, we might be using a connection string or DefaultAzureCredential
         if use_cloud_resources and connection_string and not use_azurite:
-             return AzureBlobStorageAdapter(use_connection_string=True, connection_string=connection_string)
+             return StorageConfig("connection_string", connection_string=connection_string)
 
         # Default to DefaultAzureCredential if no connection string or if explicitly in AZURE mode
         if account_url is None:
-            account_url = os.getenv("AZURE_STORAGE_ACCOUNT_URL", "")
-        return AzureBlobStorageAdapter(account_url=account_url, use_connection_string=False)
+            account_url = getenv("AZURE_STORAGE_ACCOUNT_URL", "")
+        return StorageConfig("account_url", account_url=account_url)
+
+
+def _create_storage_adapter(config: StorageConfig) -> StorageAdapter:
+    """Build a new storage adapter for a resolved configuration."""
+    if config.backend == "local":
+        return LocalFileStorageAdapter(config.local_path)
+    if config.backend == "connection_string":
+        return AzureBlobStorageAdapter(use_connection_string=True, connection_string=config.connection_string)
+    return AzureBlobStorageAdapter(account_url=config.account_url, use_connection_string=False)
@@ -180,6 +180,8 @@ CREATE INDEX idx_job_steps_status ON job_steps(status);
 CREATE INDEX idx_job_steps_step_name ON job_steps(step_name);
 CREATE INDEX idx_job_steps_worker_id ON job_steps(worker_id);
 CREATE INDEX idx_job_steps_queued_at ON job_steps(queued_at);
+-- Router's "latest step" lookup: WHERE job_id = ? AND step_name = ? ORDER BY queued_at DESC LIMIT 1
+CREATE INDEX idx_job_steps_latest ON job_steps(job_id, step_name, queued_at DESC);
 
 -- Worker metrics indexes
 CREATE INDEX idx_worker_metrics_worker_id ON worker_metrics(worker_id);
@@ -1,12 +1,28 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
+from azure.core.exceptions import ResourceExistsError
 from azure.storage.blob import BlobServiceClient
 
+CONTAINERS = ["raw-audio", "results"]
+
 conn = os.environ["AZURE_STORAGE_CONNECTION_STRING"]
 svc = BlobServiceClient.from_connection_string(conn)
-for name in ["raw-audio", "results"]:
+
+
+def ensure_container(name: str) -> None:
+    container_client = svc.get_container_client(name)
+    if container_client.exists():
+        print(f"Container exists: {name}")
+        return
     try:
-        svc.create_container(name)
+        container_client.create_container()
         print(f"Created container: {name}")
-    except Exception:
+    except ResourceExistsError:
+        # Created concurrently by another bootstrap run
         print(f"Container exists: {name}")
+
+
+# Create containers in parallel; errors other than "already exists" propagate
+with ThreadPoolExecutor(max_workers=len(CONTAINERS)) as executor:
+    list(executor.map(ensure_container, CONTAINERS))
@@ -10,86 +10,147 @@ This is a basic Streamlit app that allows users to:
 All business logic is handled by the API - this is just a UI wrapper.
 """
 
+import csv
 import io
 import os
+import time
 from typing import Any, Dict, Optional
 
-import pandas as pd
-import requests
+import httpx
 import streamlit as st
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Configuration - API endpoint
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
 
+# Longest a single wait on the job event stream may block the script; keeps button clicks responsive
+EVENT_WAIT_SECONDS = 3.0
+
+# Job status -> (icon, st.status state)
+STATUS_DISPLAY = {
+    "pending_upload": ("⏳", "running"),
+    "queued": ("📥", "running"),
+    "processing": ("🔄", "running"),
+    "completed": ("✅", "complete"),
+    "partial_complete": ("⚠️", "complete"),
+    "failed": ("❌", "error"),
+    "cancelled": ("🚫", "error"),
+}
+UNKNOWN_STATUS_DISPLAY = ("❓", "running")
+
 # Page configuration
 st.set_page_config(page_title="Speech Flow - Upload & Process", page_icon="🎤", layout="centered")
 
 st.title("🎤 Speech Flow - Audio Processing")
 st.markdown("Upload audio files and download processed results")
 
+
+@st.cache_resource
+def get_http_client() -> httpx.Client:
+    """Shared API client so reruns reuse keep-alive (and HTTP/2, over TLS) connections"""
+    return httpx.Client(
+        base_url=API_BASE_URL,
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=16),
+    )
+
+
+@st.cache_resource
+def get_pandas():
+    """Import pandas only when results are displayed (openpyxl loads on first Excel export)"""
+    import pandas as pd
+
+    return pd
+
+
 # Initialize session state
 if "job_id" not in st.session_state:
     st.session_state.job_id = None
 if "job_status" not in st.session_state:
     st.session_state.job_status = None
-if "upload_url" not in st.session_state:
-    st.session_state.upload_url = None
 if "results_data" not in st.session_state:
     st.session_state.results_data = None
+if "status_data" not in st.session_state:
+    st.session_state.status_data = None
 
 
 def submit_job(
-    audio_filename: str, workflow_type: str, source_language: Optional[str], target_language: str
+    audio_file, workflow_type: str, source_language: Optional[str], target_language: str
 ) -> Dict[str, Any]:
-    """Submit a new job to the API"""
-    payload = {"audio_filename": audio_filename, "workflow_type": workflow_type, "target_language": target_language}
+    """Submit a job, upload its audio and start processing in one API request"""
+    data = {"workflow_type": workflow_type, "target_language": target_language}
 
     if source_language:
-        payload["source_language"] = source_language
+        data["source_language"] = source_language
 
-    response = requests.post(f"{API_BASE_URL}/jobs", json=payload)
+    audio_file.seek(0)
+    files = {"audio_file": (audio_file.name, audio_file, audio_file.type or "application/octet-stream")}
+    response = get_http_client().post("/jobs/upload", data=data, files=files)
     response.raise_for_status()
-    return response.json()
-
-
-def upload_audio_file(upload_url: str, audio_file) -> bool:
-    """Upload audio file to the provided SAS URL"""
-    try:
-        # For blob storage, we need to use PUT request
-        headers = {"x-ms-blob-type": "BlockBlob"}
-        response = requests.put(upload_url, data=audio_file.getvalue(), headers=headers)
-        response.raise_for_status()
-        return True
-    except requests.exceptions.RequestException as e:
-        st.error(f"Upload failed: {str(e)}")
-        return False
-
-
-def start_job(job_id: str) -> Dict[str, Any]:
-    """Start processing a job after upload"""
-    response = requests.post(f"{API_BASE_URL}/jobs/{job_id}/start")
-    response.raise_for_status()
-    return response.json()
+    return json_loads(response.content)
 
 
 def get_job_status(job_id: str) -> Dict[str, Any]:
     """Get current status of a job"""
-    response = requests.get(f"{API_BASE_URL}/jobs/{job_id}")
+    response = get_http_client().get(f"/jobs/{job_id}")
     response.raise_for_status()
-    return response.json()
+    return json_loads(response.content)
+
+
+def wait_for_job_update(job_id: str, current: Dict[str, Any], max_wait: float) -> Optional[Dict[str, Any]]:
+    """Wait up to `max_wait` seconds on the job event stream for a status that differs from `current`.
+
+    Returns None if nothing changed in time or the stream closed.
+    """
+    deadline = time.monotonic() + max_wait
+    timeout = httpx.Timeout(max_wait, connect=5.0)
+    try:
+        with get_http_client().stream("GET", f"/jobs/{job_id}/events", timeout=timeout) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line.startswith("data:"):
+                    event = json_loads(line[len("data:") :])
+                    if event != current:
+                        return event
+                if time.monotonic() >= deadline:
+                    break
+    except httpx.ReadTimeout:
+        # No event (not even a keepalive) within max_wait
+        pass
+    return None
+
+
+@st.fragment(run_every=EVENT_WAIT_SECONDS)
+def watch_job_updates(job_id: str, current: Dict[str, Any]) -> None:
+    """Wait briefly for a pushed status change and rerun the page when one arrives.
+
+    Each fragment run blocks for at most EVENT_WAIT_SECONDS, so the rest of the page stays interactive.
+    """
+    st.caption("🔄 Job is processing... the status updates automatically")
+    try:
+        update = wait_for_job_update(job_id, current, EVENT_WAIT_SECONDS)
+    except httpx.HTTPError:
+        update = None
+
+    if update is not None:
+        st.session_state.status_data = update
+        st.rerun()
 
 
 def get_job_results(job_id: str) -> Dict[str, Any]:
     """Get results of a completed job"""
-    response = requests.get(f"{API_BASE_URL}/jobs/{job_id}/results")
+    response = get_http_client().get(f"/jobs/{job_id}/results")
     response.raise_for_status()
-    return response.json()
-
+    return json_loads(response.content)
 
-def format_results_as_dataframe(results: Dict[str, Any]) -> pd.DataFrame:
-    """Convert job results to a pandas DataFrame for download"""
-    rows = []
 
+def format_results_row(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten job results into a single export row"""
     # Basic job info
     row = {
         "Job ID": results.get("job_id"),
@@ -133,8 +194,16 @@ def format_results_as_dataframe(results: Dict[str, Any]) -> pd.DataFrame:
 
     row["Completed At"] = results.get("completed_at", "N/A")
 
-    rows.append(row)
-    return pd.DataFrame(rows)
+    return row
+
+
+def format_results_as_csv(row: Dict[str, Any]) -> str:
+    """Render a single results row as CSV without going through pandas"""
+    csv_buffer = io.StringIO()
+    writer = csv.writer(csv_buffer)
+    writer.writerow(row.keys())
+    writer.writerow(row.values())
+    return csv_buffer.getvalue()
 
 
 # ============== UI Layout ==============
@@ -182,33 +251,20 @@ if uploaded_file is not None:
             st.error("Source language is required for this workflow type")
         else:
             try:
-                with st.spinner("Submitting job..."):
-                    # Step 1: Submit job
+                with st.spinner("Uploading audio and submitting job..."):
                     job_response = submit_job(
-                        audio_filename=uploaded_file.name,
+                        audio_file=uploaded_file,
                         workflow_type=workflow_type,
                         source_language=source_language,
                         target_language=target_language,
                     )
 
-                    st.session_state.job_id = job_response["job_id"]
-                    st.session_state.upload_url = job_response["upload_url"]
-                    st.session_state.job_status = job_response["status"]
-
-                    st.success(f"Job created: {st.session_state.job_id}")
-
-                with st.spinner("Uploading audio file..."):
-                    # Step 2: Upload audio file
-                    if upload_audio_file(st.session_state.upload_url, uploaded_file):
-                        st.success("Audio file uploaded successfully")
-
-                        # Step 3: Start job processing
-                        start_response = start_job(st.session_state.job_id)
-                        st.session_state.job_status = start_response["status"]
-                        st.success("Job started! Processing...")
-                        st.rerun()
+                st.session_state.job_id = job_response["job_id"]
+                st.session_state.job_status = job_response["status"].lower()
+                st.success("Job started! Processing...")
+                st.rerun()
 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 st.error(f"Error: {str(e)}")
             except Exception as e:
                 st.error(f"Unexpected error: {str(e)}")
@@ -216,6 +272,7 @@ if uploaded_file is not None:
 st.divider()
 
 # Job status monitoring
+in_progress_status = None
 if st.session_state.job_id:
     st.header("📊 Job Status")
 
@@ -229,38 +286,22 @@ if st.session_state.job_id:
             st.rerun()
 
     try:
-        # Get current status
-        status_response = get_job_status(st.session_state.job_id)
-        st.session_state.job_status = status_response["status"]
-
-        # Display status
-        status_map = {
-            "pending_upload": ("⏳", "warning"),
-            "queued": ("📥", "info"),
-            "processing": ("🔄", "info"),
-            "completed": ("✅", "success"),
-            "partial_complete": ("⚠️", "warning"),
-            "failed": ("❌", "error"),
-            "cancelled": ("🚫", "warning"),
-        }
-
-        icon, status_type = status_map.get(st.session_state.job_status, ("❓", "info"))
-
-        if status_type == "success":
-            st.success(f"{icon} Status: **{st.session_state.job_status.upper()}**")
-        elif status_type == "error":
-            st.error(f"{icon} Status: **{st.session_state.job_status.upper()}**")
-        elif status_type == "warning":
-            st.warning(f"{icon} Status: **{st.session_state.job_status.upper()}**")
-        else:
-            st.info(f"{icon} Status: **{st.session_state.job_status.upper()}**")
-
-        # Show steps
-        if status_response.get("steps"):
-            st.subheader("Processing Steps")
-            steps_data = []
-            for step in status_response["steps"]:
-                steps_data.append(
+        # Use the status pushed by the event stream if we have one, otherwise fetch it
+        status_response = st.session_state.status_data or get_job_status(st.session_state.job_id)
+        st.session_state.status_data = None
+        # The router writes uppercase statuses ("PROCESSING"), the API lowercase ones
+        st.session_state.job_status = status_response["status"].lower()
+
+        # Display status and steps in one status container
+        icon, state = STATUS_DISPLAY.get(st.session_state.job_status, UNKNOWN_STATUS_DISPLAY)
+        steps = status_response.get("steps")
+
+        with st.status(
+            f"{icon} Status: **{st.session_state.job_status.upper()}**", state=state, expanded=bool(steps)
+        ):
+            if steps:
+                st.markdown("**Processing Steps**")
+                steps_data = [
                     {
                         "Step": step["step_type"],
                         "Status": step["status"],
@@ -268,13 +309,13 @@ if st.session_state.job_id:
                         "Completed": step.get("completed_at", "N/A"),
                         "Retries": step.get("retry_count", 0),
                     }
-                )
-
-            st.dataframe(pd.DataFrame(steps_data), use_container_width=True, hide_index=True)
+                    for step in steps
+                ]
+                st.dataframe(steps_data, use_container_width=True, hide_index=True)
 
-        # Auto-refresh for in-progress jobs
+        # In-progress jobs wait on the event stream at the end of the page
         if st.session_state.job_status in ["queued", "processing"]:
-            st.info("🔄 Job is processing... Click 'Refresh Status' button above to update")
+            in_progress_status = status_response
 
         # Download results for completed jobs
         if st.session_state.job_status in ["completed", "partial_complete"]:
@@ -288,12 +329,14 @@ if st.session_state.job_id:
                         st.session_state.results_data = results
                         st.success("Results fetched successfully!")
 
-                except requests.exceptions.RequestException as e:
+                except httpx.HTTPError as e:
                     st.error(f"Error fetching results: {str(e)}")
 
             # Display and download results
             if st.session_state.results_data:
-                results_df = format_results_as_dataframe(st.session_state.results_data)
+                pd = get_pandas()
+                results_row = format_results_row(st.session_state.results_data)
+                results_df = pd.DataFrame([results_row])
 
                 st.subheader("Results Preview")
                 st.dataframe(results_df, use_container_width=True, hide_index=True)
@@ -303,9 +346,7 @@ if st.session_state.job_id:
 
                 with col1:
                     # CSV download
-                    csv_buffer = io.StringIO()
-                    results_df.to_csv(csv_buffer, index=False)
-                    csv_data = csv_buffer.getvalue()
+                    csv_data = format_results_as_csv(results_row)
 
                     st.download_button(
                         label="📄 Download as CSV",
@@ -328,7 +369,7 @@ if st.session_state.job_id:
                         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                     )
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         st.error(f"Error checking job status: {str(e)}")
 
 # Footer
@@ -340,6 +381,10 @@ if st.session_state.job_id:
     if st.button("🔄 Start New Job"):
         st.session_state.job_id = None
         st.session_state.job_status = None
-        st.session_state.upload_url = None
         st.session_state.results_data = None
+        st.session_state.status_data = None
         st.rerun()
+
+# Watch the job event stream last so the rest of the page is already rendered
+if in_progress_status is not None:
+    watch_job_updates(st.session_state.job_id, in_progress_status)
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import os
 import sys
 
@@ -6,9 +7,9 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from common.ai_adapter import get_ai_adapter
 from common.base_worker import BaseWorker, StepMetrics
+from common.logging_config import configure_queue_logging
 
-# Initialize AI adapter (Azure OpenAI or HuggingFace based on ENVIRONMENT)
-ai_adapter = get_ai_adapter()
+logger = logging.getLogger("azure_ai")
 
 # Azure OpenAI Config (for compatibility)
 AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT", "https://my-resource.openai.azure.com/")
@@ -16,6 +17,9 @@ AZURE_OPENAI_KEY = os.getenv("AZURE_OPENAI_KEY", "")
 DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4")
 API_VERSION = "2024-02-15-preview"
 
+# Step name reported to the router for each task
+TASK_STEP_NAMES = {"summarize": "SUMMARIZE", "translate": "TRANSLATE"}
+
 
 class AzureAIWorker(BaseWorker):
     """Worker for Azure OpenAI tasks: translation and summarization with token tracking"""
@@ -23,12 +27,27 @@ class AzureAIWorker(BaseWorker):
     def __init__(self):
         queue_name = os.getenv("AZURE_AI_QUEUE_NAME", "azure-ai-jobs")
         super().__init__(queue_name=queue_name, step_name="AZURE_AI")
+        # API-bound: keep many requests in flight, bounded to respect Azure OpenAI quotas
+        self.max_concurrency = int(os.getenv("AZURE_AI_CONCURRENCY", "32"))
+
+        # Shared AI adapter (Azure OpenAI or HuggingFace based on ENVIRONMENT);
+        # SDK clients and models are loaded on first request, so this is cheap
+        self.adapter = get_ai_adapter()
+
+    def get_step_name(self, payload: dict) -> str:
+        """Report summarize/translate tasks as their own pipeline steps"""
+        return TASK_STEP_NAMES.get(payload.get("task"), self.step_name)
+
+    async def shutdown(self) -> None:
+        """Close the AI adapter's connection pool"""
+        await self.adapter.aclose()
 
-    def summarize_text(self, text: str, metrics: StepMetrics) -> str:
+    async def summarize_text(self, text: str, metrics: StepMetrics) -> str:
         """Summarize text using AI adapter with token tracking"""
-        result = ai_adapter.summarize_text(text)
+        result = await self.adapter.asummarize_text(text)
 
-        # Track token usage
+        # Track token usage (and the deployment that served the task, if the adapter reports it)
+        metrics.model_name = result.get("model", metrics.model_name)
         metrics.prompt_tokens = result["prompt_tokens"]
         metrics.completion_tokens = result["completion_tokens"]
         metrics.total_tokens = result["total_tokens"]
@@ -36,12 +55,15 @@ class AzureAIWorker(BaseWorker):
 
         return result["summary"]
 
-    def translate_text(self, text: str, target_lang: str, source_lang: str = None, metrics: StepMetrics = None) -> str:
+    async def translate_text(
+        self, text: str, target_lang: str, source_lang: str = None, metrics: StepMetrics = None
+    ) -> str:
         """Translate text using AI adapter with token tracking"""
-        result = ai_adapter.translate_text(text, target_lang, source_lang)
+        result = await self.adapter.atranslate_text(text, target_lang, source_lang)
 
         # Track token usage if metrics provided
         if metrics:
+            metrics.model_name = result.get("model", metrics.model_name)
             metrics.prompt_tokens = result["prompt_tokens"]
             metrics.completion_tokens = result["completion_tokens"]
             metrics.total_tokens = result["total_tokens"]
@@ -65,8 +87,8 @@ class AzureAIWorker(BaseWorker):
         result_data = {}
 
         if task == "summarize":
-            self.step_name = "SUMMARIZE"  # Override for correct event reporting
-            summary = self.summarize_text(input_text, metrics)
+            # Model calls are async (native client or worker thread), so the event loop stays responsive
+            summary = await self.summarize_text(input_text, metrics)
             result_data = {
                 "summary": summary,
                 "input_char_count": len(input_text),
@@ -74,13 +96,12 @@ class AzureAIWorker(BaseWorker):
                 "tokens_used": metrics.total_tokens,
                 "cost_usd": metrics.api_cost_usd,
             }
-            print(f"[AZURE] Summarization complete. Tokens: {metrics.total_tokens}, Cost: ${metrics.api_cost_usd:.4f}")
+            logger.info("Summarization complete. Tokens: %d, Cost: $%.4f", metrics.total_tokens, metrics.api_cost_usd)
 
         elif task == "translate":
-            self.step_name = "TRANSLATE"
             target_lang = payload.get("target_lang", "en")
             source_lang = payload.get("source_lang", None)
-            translation = self.translate_text(input_text, target_lang, source_lang, metrics)
+            translation = await self.translate_text(input_text, target_lang, source_lang, metrics)
             result_data = {
                 "translation": translation,
                 "source_language": source_lang or "unknown",
@@ -90,23 +111,28 @@ class AzureAIWorker(BaseWorker):
                 "tokens_used": metrics.total_tokens,
                 "cost_usd": metrics.api_cost_usd,
             }
-            print(f"[AZURE] Translation complete. Tokens: {metrics.total_tokens}, Cost: ${metrics.api_cost_usd:.4f}")
+            logger.info("Translation complete. Tokens: %d, Cost: $%.4f", metrics.total_tokens, metrics.api_cost_usd)
 
         else:
             metrics.error_code = "UNKNOWN_TASK"
             raise ValueError(f"Unknown task: {task}")
 
-        # Upload result
-        blob_path = self.upload_result(job_id, task, result_data)
+        # Upload result (blocking SDK/file IO runs off the event loop)
+        blob_path = await self.aupload_result(job_id, task, result_data)
 
         return {
             "blob_path": blob_path,
-            "preview": str(result_data)[:100],
+            "preview": (result_data.get("summary") or result_data.get("translation") or "")[:100],
             "tokens_used": metrics.total_tokens,
             "cost_usd": metrics.api_cost_usd,
         }
 
 
 if __name__ == "__main__":
-    worker = AzureAIWorker()
-    asyncio.run(worker.run())
+    # Log writes happen on a background thread so concurrent handlers never block on stdout
+    log_listener = configure_queue_logging()
+    try:
+        worker = AzureAIWorker()
+        asyncio.run(worker.run())
+    finally:
+        log_listener.stop()
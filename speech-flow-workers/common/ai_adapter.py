@@ -5,9 +5,268 @@ This module provides a unified interface for AI operations that works with:
 - HuggingFace Transformers (for local development)
 """
 
+import asyncio
+import hashlib
+import json
+import logging
 import os
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Azure AD scope for Azure OpenAI and refresh margin for cached tokens
+COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+# Multilingual translation model covering 200 languages (FLORES-200 codes)
+NLLB_MODEL = "facebook/nllb-200-distilled-600M"
+
+# Static prompt prefixes. Keep them byte-for-byte stable and first in the message list so
+# Azure OpenAI prompt caching can match them across requests.
+SUMMARIZE_SYSTEM_PROMPT = (
+    "You are a helpful assistant that summarizes text concisely. "
+    "Include key points as a bulleted list at the end."
+)
+SUMMARIZE_USER_PREFIX = "Summarize the following text:\n\n"
+TRANSLATE_SYSTEM_TEMPLATE = (
+    "You are a translator. Translate the following text to {target_language}. "
+    "Preserve the original meaning and tone."
+)
+_SUMMARIZE_SYSTEM_MESSAGE = {"role": "system", "content": SUMMARIZE_SYSTEM_PROMPT}
+
+
+# Long inputs are split on sentence boundaries into chunks of CHUNK tokens, processed
+# concurrently and (for summaries) reduced in rounds until the partial summaries fit in
+# one call. Token counts use tiktoken's GPT-4 encoding when available, else a
+# character-based estimate.
+TOKEN_ENCODING = "cl100k_base"
+CHARS_PER_TOKEN_ESTIMATE = 4
+_SENTENCE_END = re.compile(r"[.!?]+\s+|[。！？]+\s*")
+
+
+@lru_cache(maxsize=1)
+def _get_token_encoding():
+    """tiktoken encoding used to measure inputs, or None when tiktoken is unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(TOKEN_ENCODING)
+    except Exception as e:
+        # Not installed, or the BPE file could not be fetched (offline container)
+        logger.warning("tiktoken unavailable (%s); estimating token counts from text length", e)
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count (or, without tiktoken, estimate) the prompt tokens in text."""
+    encoding = _get_token_encoding()
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN_ESTIMATE + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _split_oversized(text: str, max_tokens: int) -> List[str]:
+    """Hard-split a single sentence that alone exceeds max_tokens."""
+    encoding = _get_token_encoding()
+    if encoding is None:
+        # Largest piece whose count_tokens estimate (len // CHARS + 1) stays within max_tokens
+        step = max(max_tokens * CHARS_PER_TOKEN_ESTIMATE - 1, 1)
+        return [text[i : i + step] for i in range(0, len(text), step)]
+    tokens = encoding.encode(text, disallowed_special=())
+    return [encoding.decode(tokens[i : i + max_tokens]) for i in range(0, len(tokens), max_tokens)]
+
+
+def split_text(text: str, max_tokens: int) -> List[str]:
+    """Split text into chunks of at most max_tokens, breaking on sentence boundaries where possible.
+
+    Args:
+        text: Text to split
+        max_tokens: Token budget per chunk
+
+    Returns:
+        Chunks in original order
+    """
+    # Sentences keep their trailing punctuation and whitespace so chunks re-join losslessly
+    ends = [match.end() for match in _SENTENCE_END.finditer(text)]
+    sentences = [text[start:end] for start, end in zip([0] + ends, ends + [len(text)]) if start < end]
+
+    chunks: List[str] = []
+    current = ""
+    current_tokens = 0
+    for sentence in sentences:
+        sentence_tokens = count_tokens(sentence)
+        if current.strip() and current_tokens + sentence_tokens > max_tokens:
+            chunks.append(current.strip())
+            current, current_tokens = "", 0
+        if sentence_tokens > max_tokens:
+            chunks.extend(piece.strip() for piece in _split_oversized(sentence, max_tokens) if piece.strip())
+            continue
+        current += sentence
+        current_tokens += sentence_tokens
+    if current.strip():
+        chunks.append(current.strip())
+    return chunks
+
+
+@lru_cache(maxsize=64)
+def _translate_system_message(target_language: str) -> Dict[str, str]:
+    """Return the (shared, read-only) translation system message for a target language."""
+    return {"role": "system", "content": TRANSLATE_SYSTEM_TEMPLATE.format(target_language=target_language)}
+
+
+class ResponseCache:
+    """Bounded LRU cache of model results keyed by the exact request content.
+
+    Hits are returned with zero token usage and cost, and cache_hit=True.
+    """
+
+    def __init__(self, max_entries: int):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum cached results (0 disables caching)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from request parts (task, model, language, text)."""
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result marked as a free cache hit, or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                return None
+            self._entries.move_to_end(key)
+        return dict(result, prompt_tokens=0, completion_tokens=0, total_tokens=0, cost_usd=0.0, cache_hit=True)
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class RequestRateLimiter:
+    """Space requests evenly to stay under a requests-per-minute quota.
+
+    Each caller reserves the next free slot and sleeps until it; a limit of 0 disables limiting.
+    """
+
+    def __init__(self, requests_per_minute: float):
+        """Initialize limiter.
+
+        Args:
+            requests_per_minute: Sustained request rate to stay below (0 disables limiting)
+        """
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Reserve the next slot and return how long to wait for it."""
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        return slot - now
+
+    def wait(self) -> None:
+        """Block until the caller may send a request."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def await_slot(self) -> None:
+        """Wait (without blocking the event loop) until the caller may send a request."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class MicroBatcher:
+    """Coalesce concurrent async requests into batched calls of a blocking function.
+
+    Requests arriving within max_wait_s of the first one (up to max_batch_size) are
+    passed to run_batch together in a worker thread; each caller gets its own result.
+    """
+
+    def __init__(self, run_batch: Callable[[List[Any]], List[Any]], max_batch_size: int, max_wait_s: float):
+        """Initialize batcher.
+
+        Args:
+            run_batch: Blocking function mapping a list of items to a list of results (same order)
+            max_batch_size: Maximum items per call
+            max_wait_s: Maximum time to wait for more items after the first one
+        """
+        self.run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_s
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result."""
+        if self._consumer is None or self._consumer.done():
+            self._queue = asyncio.Queue()
+            self._consumer = asyncio.create_task(self._consume())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop the consumer task; a later submit starts a new one."""
+        if self._consumer is None:
+            return
+        self._consumer.cancel()
+        try:
+            await self._consumer
+        except asyncio.CancelledError:
+            pass
+        self._consumer = None
+
+    async def _consume(self) -> None:
+        """Collect batches from the queue and run them one at a time."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_s
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                results = await asyncio.to_thread(self.run_batch, [item for item, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
 
 
 class AIModelAdapter(ABC):
@@ -22,7 +281,8 @@ class AIModelAdapter(ABC):
 
         Returns:
             Dict with keys: 'summary', 'prompt_tokens', 'completion_tokens',
-            'total_tokens', 'cost_usd'
+            'total_tokens', 'cost_usd' (plus 'model' when the adapter reports the deployment
+            used, and 'cache_hit' when served from cache)
         """
         pass
 
@@ -37,10 +297,27 @@ class AIModelAdapter(ABC):
 
         Returns:
             Dict with keys: 'translation', 'prompt_tokens', 'completion_tokens',
-            'total_tokens', 'cost_usd'
+            'total_tokens', 'cost_usd' (plus 'model' when the adapter reports the deployment
+            used, and 'cache_hit' when served from cache)
         """
         pass
 
+    # Async variants: adapters without a native async client run the blocking
+    # call in a worker thread so the worker's event loop is never stalled.
+
+    async def asummarize_text(self, text: str) -> Dict[str, Any]:
+        """Async variant of summarize_text."""
+        return await asyncio.to_thread(self.summarize_text, text)
+
+    async def atranslate_text(
+        self, text: str, target_language: str, source_language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async variant of translate_text."""
+        return await asyncio.to_thread(self.translate_text, text, target_language, source_language)
+
+    async def aclose(self) -> None:
+        """Release network resources held by the adapter. No-op by default."""
+
 
 class AzureOpenAIAdapter(AIModelAdapter):
     """Azure OpenAI implementation using DefaultAzureCredential or API key."""
@@ -62,116 +339,313 @@ class AzureOpenAIAdapter(AIModelAdapter):
             use_azure_ad: Whether to use DefaultAzureCredential (True) or API key (False)
             api_version: API version
         """
-        from openai import AzureOpenAI
-
         self.endpoint = endpoint
         self.deployment = deployment
         self.api_version = api_version
-        self.use_azure_ad = use_azure_ad
+        self.use_azure_ad = use_azure_ad and not api_key
+        self.api_key = api_key
 
-        if use_azure_ad and not api_key:
-            # Use DefaultAzureCredential (production)
-            from azure.core.credentials import AccessToken
-            from azure.identity import DefaultAzureCredential
-
-            # Create token provider for OpenAI SDK
-            credential = DefaultAzureCredential()
-
-            # Get token for Azure Cognitive Services
-            token = credential.get_token("https://cognitiveservices.azure.com/.default")
-
-            self.client = AzureOpenAI(azure_endpoint=endpoint, azure_ad_token=token.token, api_version=api_version)
-            self.credential = credential
-        else:
-            # Use API key (legacy or local testing)
-            self.client = AzureOpenAI(azure_endpoint=endpoint, api_key=api_key, api_version=api_version)
-            self.credential = None
+        # Clients, credential and token are created on first use: importing openai and
+        # azure.identity dominates worker cold start, and most processes only need one client
+        self._client = None
+        self._async_client = None
+        self.credential = None
+        self._token = None
+        self._token_lock = threading.Lock()
 
         # Cost per 1000 tokens
         self.cost_per_1k_input = float(os.getenv("AZURE_OPENAI_INPUT_COST", "0.01"))
         self.cost_per_1k_output = float(os.getenv("AZURE_OPENAI_OUTPUT_COST", "0.03"))
 
-    def _calculate_cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        # Per-task deployments: translation and short summaries rarely need the main (largest) model.
+        # Both default to `deployment`; point them at e.g. a gpt-4o-mini deployment to cut latency and cost
+        self.summarize_deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_SUMMARIZE") or deployment
+        self.translate_deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_TRANSLATE") or deployment
+        # Output cap for the per-chunk summaries of long text (0 = uncapped); the final summary is never capped
+        chunk_summary_max_tokens = int(os.getenv("AZURE_OPENAI_CHUNK_SUMMARY_MAX_TOKENS", "512"))
+        self._chunk_summary_params = {"max_tokens": chunk_summary_max_tokens} if chunk_summary_max_tokens > 0 else {}
+
+        # Request parameters by result key; translation is deterministic
+        self._request_params: Dict[str, Dict[str, Any]] = {
+            "summary": {"model": self.summarize_deployment},
+            "translation": {"model": self.translate_deployment, "temperature": 0},
+        }
+
+        # Per-token cost by deployment; AZURE_OPENAI_DEPLOYMENT_COSTS maps deployment names to
+        # [input, output] cost per 1000 tokens, others use the AZURE_OPENAI_*_COST defaults
+        deployment_costs = json.loads(os.getenv("AZURE_OPENAI_DEPLOYMENT_COSTS", "{}"))
+        self._default_token_costs = (self.cost_per_1k_input / 1000, self.cost_per_1k_output / 1000)
+        self._token_costs: Dict[str, Tuple[float, float]] = {
+            name: (float(input_cost) / 1000, float(output_cost) / 1000)
+            for name, (input_cost, output_cost) in deployment_costs.items()
+        }
+
+        # Repeated identical requests (e.g. redelivered messages, duplicate uploads) skip the API
+        self.cache = ResponseCache(int(os.getenv("AI_RESPONSE_CACHE_SIZE", "256")))
+
+        # Async connection pool, sized above the worker's in-flight message limit so
+        # concurrent requests reuse (and, over HTTP/2, multiplex on) warm connections
+        self.max_connections = int(os.getenv("AZURE_OPENAI_MAX_CONNECTIONS", "256"))
+        self.max_keepalive_connections = int(os.getenv("AZURE_OPENAI_MAX_KEEPALIVE", "128"))
+
+        # Throttling: the SDK retries 408/429/5xx and connection errors with jittered exponential
+        # backoff and honours Retry-After; the optional limiter keeps us under the deployment's RPM
+        self.max_retries = int(os.getenv("AZURE_OPENAI_MAX_RETRIES", "6"))
+        self.rate_limiter = RequestRateLimiter(float(os.getenv("AZURE_OPENAI_RPM_LIMIT", "0")))
+
+        # Inputs above max_input_tokens are split into chunk_tokens-sized pieces
+        self.max_input_tokens = int(os.getenv("AZURE_OPENAI_MAX_INPUT_TOKENS", "6000"))
+        self.chunk_tokens = int(os.getenv("AZURE_OPENAI_CHUNK_TOKENS", "4000"))
+
+    def _calculate_cost(self, prompt_tokens: int, completion_tokens: int, deployment: Optional[str] = None) -> float:
         """Calculate API cost.
 
         Args:
             prompt_tokens: Number of prompt tokens
             completion_tokens: Number of completion tokens
+            deployment: Deployment that served the request (None = default rates)
 
         Returns:
-            Cost in USD
+            Cost in USD, unrounded (stored as NUMERIC(10, 6); round only for display)
         """
-        input_cost = (prompt_tokens / 1000) * self.cost_per_1k_input
-        output_cost = (completion_tokens / 1000) * self.cost_per_1k_output
-        return round(input_cost + output_cost, 6)
+        input_cost, output_cost = self._token_costs.get(deployment, self._default_token_costs)
+        return prompt_tokens * input_cost + completion_tokens * output_cost
+
+    def _client_kwargs(self, token_provider) -> Dict[str, Any]:
+        """Constructor arguments shared by the sync and async clients."""
+        kwargs = {"azure_endpoint": self.endpoint, "api_version": self.api_version, "max_retries": self.max_retries}
+        if self.use_azure_ad:
+            # The SDK asks the provider for a token per request; the provider serves it from cache
+            kwargs["azure_ad_token_provider"] = token_provider
+        else:
+            # Use API key (legacy or local testing)
+            kwargs["api_key"] = self.api_key
+        return kwargs
+
+    @property
+    def client(self):
+        """Sync Azure OpenAI client, created on first use."""
+        if self._client is None:
+            from openai import AzureOpenAI
+
+            self._client = AzureOpenAI(**self._client_kwargs(self._get_token))
+        return self._client
+
+    @property
+    def async_client(self):
+        """Async Azure OpenAI client, created on first use."""
+        if self._async_client is None:
+            from openai import AsyncAzureOpenAI
+
+            self._async_client = AsyncAzureOpenAI(
+                http_client=self._build_async_http_client(), **self._client_kwargs(self._aget_token)
+            )
+        return self._async_client
+
+    def _build_async_http_client(self):
+        """Pooled HTTP/2 client for the async SDK client (the SDK default caps keep-alive at 20)."""
+        import httpx
+
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,  # connection failures only; the SDK retries HTTP errors itself
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=120,
+            ),
+        )
+        return httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(60.0, connect=5.0))
+
+    async def aclose(self) -> None:
+        """Close the async client and its connection pool."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def _token_is_fresh(self) -> bool:
+        """Whether the cached token is valid beyond the refresh margin."""
+        return self._token is not None and self._token.expires_on - TOKEN_REFRESH_MARGIN_SECONDS > time.time()
+
+    def _get_token(self) -> str:
+        """Azure AD token provider: return the cached token, refreshing it near expiry."""
+        if not self._token_is_fresh():
+            with self._token_lock:
+                if not self._token_is_fresh():
+                    if self.credential is None:
+                        # Use DefaultAzureCredential (production)
+                        from azure.identity import DefaultAzureCredential
+
+                        self.credential = DefaultAzureCredential()
+                    self._token = self.credential.get_token(COGNITIVE_SERVICES_SCOPE)
+        return self._token.token
+
+    async def _aget_token(self) -> str:
+        """Async token provider; only a refresh (which may hit the identity endpoint) leaves the event loop."""
+        if self._token_is_fresh():
+            return self._token.token
+        return await asyncio.to_thread(self._get_token)
+
+    @staticmethod
+    def _summarize_messages(text: str) -> List[Dict[str, str]]:
+        """Build chat messages for summarization."""
+        return [_SUMMARIZE_SYSTEM_MESSAGE, {"role": "user", "content": SUMMARIZE_USER_PREFIX + text}]
+
+    @staticmethod
+    def _translate_messages(text: str, target_language: str) -> List[Dict[str, str]]:
+        """Build chat messages for translation."""
+        return [_translate_system_message(target_language), {"role": "user", "content": text}]
+
+    def _completion_result(self, response, output_key: str, deployment: str) -> Dict[str, Any]:
+        """Extract content, token usage and cost from a chat completion.
 
-    def _refresh_token_if_needed(self) -> None:
-        """Refresh Azure AD token if using DefaultAzureCredential."""
-        if self.use_azure_ad and self.credential:
-            token = self.credential.get_token("https://cognitiveservices.azure.com/.default")
-            # Update client with new token
-            self.client._azure_ad_token = token.token
+        Args:
+            response: Chat completion response
+            output_key: Result key for the completion text ('summary' or 'translation')
+            deployment: Deployment that served the request
 
-    def summarize_text(self, text: str) -> Dict[str, Any]:
-        """Summarize text using Azure OpenAI."""
-        self._refresh_token_if_needed()
-
-        response = self.client.chat.completions.create(
-            model=self.deployment,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a helpful assistant that summarizes text concisely. "
-                        "Include key points as a bulleted list at the end."
-                    ),
-                },
-                {"role": "user", "content": f"Summarize the following text:\n\n{text}"},
-            ],
-        )
+        Returns:
+            Result dict as documented on AIModelAdapter, plus the deployment as 'model'
+        """
+        if response.choices[0].finish_reason == "length":
+            logger.warning("Azure OpenAI %s from %s was truncated at the max_tokens limit", output_key, deployment)
 
         prompt_tokens = response.usage.prompt_tokens if response.usage else 0
         completion_tokens = response.usage.completion_tokens if response.usage else 0
         total_tokens = response.usage.total_tokens if response.usage else 0
 
         return {
-            "summary": response.choices[0].message.content,
+            output_key: response.choices[0].message.content,
             "prompt_tokens": prompt_tokens,
             "completion_tokens": completion_tokens,
             "total_tokens": total_tokens,
-            "cost_usd": self._calculate_cost(prompt_tokens, completion_tokens),
+            "cost_usd": self._calculate_cost(prompt_tokens, completion_tokens, deployment),
+            "model": deployment,
         }
 
-    def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None) -> Dict[str, Any]:
-        """Translate text using Azure OpenAI."""
-        self._refresh_token_if_needed()
-
-        response = self.client.chat.completions.create(
-            model=self.deployment,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        f"You are a translator. Translate the following text to "
-                        f"{target_language}. Preserve the original meaning and tone."
-                    ),
-                },
-                {"role": "user", "content": text},
-            ],
-        )
-
-        prompt_tokens = response.usage.prompt_tokens if response.usage else 0
-        completion_tokens = response.usage.completion_tokens if response.usage else 0
-        total_tokens = response.usage.total_tokens if response.usage else 0
-
+    @staticmethod
+    def _merge_results(output_key: str, output: str, parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine the results of several calls into one, summing token usage and cost."""
         return {
-            "translation": response.choices[0].message.content,
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-            "total_tokens": total_tokens,
-            "cost_usd": self._calculate_cost(prompt_tokens, completion_tokens),
+            output_key: output,
+            "prompt_tokens": sum(part["prompt_tokens"] for part in parts),
+            "completion_tokens": sum(part["completion_tokens"] for part in parts),
+            "total_tokens": sum(part["total_tokens"] for part in parts),
+            "cost_usd": sum(part["cost_usd"] for part in parts),
+            "model": parts[-1]["model"],
         }
 
+    def _input_chunks(self, text: str) -> List[str]:
+        """Return text as a single chunk, or split it when it exceeds max_input_tokens."""
+        if count_tokens(text) <= self.max_input_tokens:
+            return [text]
+        return split_text(text, self.chunk_tokens)
+
+    def _reduce_chunks(self, chunks: List[str], parts: List[Dict[str, Any]]) -> List[str]:
+        """Join one round of chunk summaries and re-chunk them for the next round.
+
+        Rounds repeat until the joined summaries fit in a single call (max_input_tokens).
+        """
+        reduced = self._input_chunks("\n\n".join(part["summary"] for part in parts))
+        if len(reduced) >= len(chunks):
+            raise ValueError("Chunk summaries are not shrinking; cannot reduce them to max_input_tokens")
+        return reduced
+
+    def _complete(self, messages: List[Dict[str, str]], output_key: str, **overrides: Any) -> Dict[str, Any]:
+        """Run one chat completion with the sync client, using the task's deployment and parameters."""
+        params = {**self._request_params[output_key], **overrides}
+        self.rate_limiter.wait()
+        response = self.client.chat.completions.create(messages=messages, **params)
+        return self._completion_result(response, output_key, params["model"])
+
+    async def _acomplete(self, messages: List[Dict[str, str]], output_key: str, **overrides: Any) -> Dict[str, Any]:
+        """Run one chat completion with the async client, using the task's deployment and parameters."""
+        params = {**self._request_params[output_key], **overrides}
+        await self.rate_limiter.await_slot()
+        response = await self.async_client.chat.completions.create(messages=messages, **params)
+        return self._completion_result(response, output_key, params["model"])
+
+    def summarize_text(self, text: str) -> Dict[str, Any]:
+        """Summarize text using Azure OpenAI; long text is summarized per chunk, then the chunk
+        summaries are combined (in further rounds while they exceed max_input_tokens)."""
+        key = self.cache.make_key("summarize", self.summarize_deployment, text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        chunks = self._input_chunks(text)
+        parts: List[Dict[str, Any]] = []
+        while len(chunks) > 1:
+            round_parts = [
+                self._complete(self._summarize_messages(chunk), "summary", **self._chunk_summary_params)
+                for chunk in chunks
+            ]
+            parts.extend(round_parts)
+            chunks = self._reduce_chunks(chunks, round_parts)
+        final = self._complete(self._summarize_messages(chunks[0]), "summary")
+        result = self._merge_results("summary", final["summary"], [*parts, final]) if parts else final
+        self.cache.put(key, result)
+        return result
+
+    def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None) -> Dict[str, Any]:
+        """Translate text using Azure OpenAI; long text is translated per chunk."""
+        key = self.cache.make_key("translate", self.translate_deployment, target_language, text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        chunks = self._input_chunks(text)
+        parts = [self._complete(self._translate_messages(chunk, target_language), "translation") for chunk in chunks]
+        if len(parts) == 1:
+            result = parts[0]
+        else:
+            result = self._merge_results("translation", " ".join(part["translation"] for part in parts), parts)
+        self.cache.put(key, result)
+        return result
+
+    async def asummarize_text(self, text: str) -> Dict[str, Any]:
+        """Summarize text using the async Azure OpenAI client; chunks of long text run concurrently."""
+        key = self.cache.make_key("summarize", self.summarize_deployment, text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        chunks = self._input_chunks(text)
+        parts: List[Dict[str, Any]] = []
+        while len(chunks) > 1:
+            round_parts = await asyncio.gather(
+                *(
+                    self._acomplete(self._summarize_messages(chunk), "summary", **self._chunk_summary_params)
+                    for chunk in chunks
+                )
+            )
+            parts.extend(round_parts)
+            chunks = self._reduce_chunks(chunks, round_parts)
+        final = await self._acomplete(self._summarize_messages(chunks[0]), "summary")
+        result = self._merge_results("summary", final["summary"], [*parts, final]) if parts else final
+        self.cache.put(key, result)
+        return result
+
+    async def atranslate_text(
+        self, text: str, target_language: str, source_language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Translate text using the async Azure OpenAI client; chunks of long text run concurrently."""
+        key = self.cache.make_key("translate", self.translate_deployment, target_language, text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        chunks = self._input_chunks(text)
+        parts = await asyncio.gather(
+            *(self._acomplete(self._translate_messages(chunk, target_language), "translation") for chunk in chunks)
+        )
+        if len(parts) == 1:
+            result = parts[0]
+        else:
+            result = self._merge_results("translation", " ".join(part["translation"] for part in parts), parts)
+        self.cache.put(key, result)
+        return result
+
 
 class HuggingFaceAdapter(AIModelAdapter):
     """HuggingFace local models implementation for development."""
@@ -182,113 +656,245 @@ class HuggingFaceAdapter(AIModelAdapter):
         self.summarization_model_name = os.getenv(
             "HF_SUMMARIZATION_MODEL", "facebook/bart-large-cnn"  # Good quality summarization model
         )
-        self.translation_model_name = os.getenv(
-            "HF_TRANSLATION_MODEL", "Helsinki-NLP/opus-mt-{src}-{tgt}"  # Template for translation models
+        # One multilingual model serves all pairs; a "{src}"/"{tgt}" template loads one model per pair
+        self.translation_model_name = os.getenv("HF_TRANSLATION_MODEL", NLLB_MODEL)
+
+        # Optional ONNX Runtime INT8 inference (requires optimum[onnxruntime])
+        self.use_onnx = os.getenv("HF_USE_ONNX", "false").lower() == "true"
+        self.onnx_cache_dir = os.getenv(
+            "HF_ONNX_CACHE_DIR", os.path.join(os.getenv("MODEL_CACHE_DIR", "/models"), "onnx")
         )
 
         self._summarization_pipeline = None
-        self._translation_pipelines = {}  # Cache translation models
+        self._translation_pipelines = {}  # Cache translation models by name (None = failed to load)
+        self._load_lock = threading.Lock()  # Batches for different pairs must not load a model twice
 
-    def _get_summarization_pipeline(self):
-        """Lazy load summarization pipeline."""
-        if self._summarization_pipeline is None:
-            from transformers import pipeline
+        # Concurrent async requests are coalesced into batched pipeline calls
+        self.batch_size = int(os.getenv("HF_BATCH_SIZE", "16"))
+        self.batch_wait_s = int(os.getenv("HF_BATCH_WAIT_MS", "20")) / 1000
+        self._summarize_batcher = MicroBatcher(self._summarize_batch, self.batch_size, self.batch_wait_s)
+        self._translate_batchers: Dict[Tuple[str, str], MicroBatcher] = {}
 
-            print(f"Loading summarization model: {self.summarization_model_name}")
-            self._summarization_pipeline = pipeline(
-                "summarization", model=self.summarization_model_name, device=-1  # CPU
-            )
-        return self._summarization_pipeline
+    def _build_pipeline(self, task: str, model_name: str):
+        """Build a pipeline on GPU in half precision when CUDA is available, otherwise on CPU
+        (using the quantized ONNX model when enabled and available).
 
-    def _get_translation_pipeline(self, source_lang: str, target_lang: str):
-        """Lazy load translation pipeline for specific language pair"""
-        key = f"{source_lang}-{target_lang}"
+        Args:
+            task: Pipeline task ("summarization" or "translation")
+            model_name: HuggingFace model ID
 
-        if key not in self._translation_pipelines:
-            from transformers import pipeline
+        Returns:
+            transformers pipeline
+        """
+        import torch
+        from transformers import pipeline
 
-            # Build model name from template
-            if "{src}" in self.translation_model_name:
-                model_name = self.translation_model_name.format(src=source_lang, tgt=target_lang)
-            else:
-                model_name = self.translation_model_name
+        if torch.cuda.is_available():
+            # BF16 keeps FP32's exponent range on Ampere+; FP16 elsewhere
+            dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            return pipeline(task, model=model_name, device=0, torch_dtype=dtype)
 
-            print(f"Loading translation model: {model_name}")
+        if self.use_onnx:
             try:
-                self._translation_pipelines[key] = pipeline("translation", model=model_name, device=-1)  # CPU
-            except Exception as e:
-                print(f"Error loading translation model {model_name}: {e}")
-                # Fallback to a generic multilingual model
-                print("Falling back to NLLB-200 model")
-                model_name = "facebook/nllb-200-distilled-600M"
-                self._translation_pipelines[key] = pipeline("translation", model=model_name, device=-1)
+                model, tokenizer = self._load_onnx_int8(model_name)
+                return pipeline(task, model=model, tokenizer=tokenizer)
+            except ImportError as e:
+                logger.warning("ONNX Runtime unavailable (%s); using PyTorch model", e)
 
-        return self._translation_pipelines[key]
+        return pipeline(task, model=model_name, device=-1)  # CPU
 
-    def summarize_text(self, text: str) -> Dict[str, Any]:
-        """Summarize text using HuggingFace model"""
-        pipeline = self._get_summarization_pipeline()
+    def _load_onnx_int8(self, model_name: str):
+        """Export a seq2seq model to ONNX and dynamically quantize it to INT8 (cached on disk).
 
-        # BART model has a max length of 1024 tokens
-        # Truncate input if too long
-        max_input_length = 1024
-        if len(text.split()) > max_input_length:
-            text = " ".join(text.split()[:max_input_length])
+        Args:
+            model_name: HuggingFace model ID
+
+        Returns:
+            Tuple of (ORTModelForSeq2SeqLM, tokenizer)
+        """
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        model_dir = os.path.join(self.onnx_cache_dir, model_name.replace("/", "--"))
+        export_dir = os.path.join(model_dir, "fp32")
+        quantized_dir = os.path.join(model_dir, "int8")
+
+        if not os.path.isdir(quantized_dir):
+            logger.info("Exporting %s to ONNX and quantizing to INT8", model_name)
+            model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+            model.save_pretrained(export_dir)
+
+            # Dynamic quantization: weights to INT8 offline, activations quantized at runtime
+            # Written to a temp dir and renamed so an interrupted export is redone, not half-loaded
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            staging_dir = f"{quantized_dir}.tmp"
+            for file_name in sorted(os.listdir(export_dir)):
+                if file_name.endswith(".onnx"):
+                    quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=file_name)
+                    quantizer.quantize(save_dir=staging_dir, quantization_config=qconfig)
+
+            model.config.save_pretrained(staging_dir)
+            AutoTokenizer.from_pretrained(model_name).save_pretrained(staging_dir)
+            os.replace(staging_dir, quantized_dir)
+
+        quantized = {name.replace("_quantized.onnx", ""): name for name in os.listdir(quantized_dir)}
+        model = ORTModelForSeq2SeqLM.from_pretrained(
+            quantized_dir,
+            encoder_file_name=quantized["encoder_model"],
+            decoder_file_name=quantized["decoder_model"],
+            decoder_with_past_file_name=quantized.get("decoder_with_past_model"),
+            use_cache="decoder_with_past_model" in quantized,
+        )
+        return model, AutoTokenizer.from_pretrained(quantized_dir)
+
+    def _get_summarization_pipeline(self):
+        """Lazy load summarization pipeline."""
+        if self._summarization_pipeline is None:
+            logger.info("Loading summarization model: %s", self.summarization_model_name)
+            self._summarization_pipeline = self._build_pipeline("summarization", self.summarization_model_name)
+        return self._summarization_pipeline
+
+    def _load_translation_pipeline(self, model_name: str):
+        """Load (once) and cache a translation pipeline; returns None if the model failed to load."""
+        with self._load_lock:
+            if model_name not in self._translation_pipelines:
+                logger.info("Loading translation model: %s", model_name)
+                try:
+                    self._translation_pipelines[model_name] = self._build_pipeline("translation", model_name)
+                except Exception as e:
+                    logger.error("Error loading translation model %s: %s", model_name, e)
+                    self._translation_pipelines[model_name] = None
+        return self._translation_pipelines[model_name]
 
-        result = pipeline(text, max_length=150, min_length=40, do_sample=False)
+    def _get_translation_pipeline(self, source_lang: str, target_lang: str) -> Tuple[Any, Dict[str, Any]]:
+        """Lazy load the translation pipeline for a language pair.
 
-        summary = result[0]["summary_text"]
+        Multilingual models (the NLLB-200 default) are loaded once and shared by every pair,
+        which is told the FLORES-200 source/target codes per call.
 
-        # Estimate token counts (rough approximation)
+        Args:
+            source_lang: ISO 639-1 source language code
+            target_lang: ISO 639-1 target language code
+
+        Returns:
+            Tuple of (pipeline, keyword arguments for calling it)
+        """
+        model_name = self.translation_model_name
+        if "{src}" in model_name:
+            pipeline = self._load_translation_pipeline(model_name.format(src=source_lang, tgt=target_lang))
+            if pipeline is not None:
+                return pipeline, {}
+            # Fallback to a generic multilingual model
+            model_name = NLLB_MODEL
+
+        pipeline = self._load_translation_pipeline(model_name)
+        if pipeline is None:
+            raise RuntimeError(f"Translation model {model_name} could not be loaded")
+        return pipeline, {
+            "src_lang": self.FLORES_CODES.get(source_lang, source_lang),
+            "tgt_lang": self.FLORES_CODES.get(target_lang, target_lang),
+            "max_length": 512,
+        }
+
+    # Map common language codes to FLORES-200 (other values are passed through unchanged)
+    FLORES_CODES = {
+        "en": "eng_Latn",
+        "es": "spa_Latn",
+        "fr": "fra_Latn",
+        "de": "deu_Latn",
+        "it": "ita_Latn",
+        "pt": "por_Latn",
+        "ru": "rus_Cyrl",
+        "ar": "arb_Arab",
+        "hi": "hin_Deva",
+        "zh": "zho_Hans",
+        "yue": "yue_Hant",
+        "ja": "jpn_Jpan",
+        "ko": "kor_Hang",
+    }
+
+    @staticmethod
+    def _estimate_result(output_key: str, text: str, output: str) -> Dict[str, Any]:
+        """Build a result dict with estimated (whitespace) token counts."""
         prompt_tokens = len(text.split())
-        completion_tokens = len(summary.split())
-        total_tokens = prompt_tokens + completion_tokens
+        completion_tokens = len(output.split())
 
         return {
-            "summary": summary,
+            output_key: output,
             "prompt_tokens": prompt_tokens,
             "completion_tokens": completion_tokens,
-            "total_tokens": total_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
             "cost_usd": 0.0,  # Local models are free
         }
 
-    def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None) -> Dict[str, Any]:
-        """Translate text using HuggingFace model"""
-        # Map common language codes
-        lang_map = {
-            "en": "eng",
-            "es": "spa",
-            "fr": "fra",
-            "de": "deu",
-            "zh": "zho",
-            "ja": "jpn",
-            "ko": "kor",
-        }
+    def _summarize_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Summarize several texts in one batched pipeline call."""
+        pipeline = self._get_summarization_pipeline()
+
+        # BART model has a max length of 1024 tokens
+        # Truncate input if too long
+        max_input_length = 1024
+        inputs = []
+        for text in texts:
+            words = text.split()
+            inputs.append(" ".join(words[:max_input_length]) if len(words) > max_input_length else text)
 
-        src_lang = lang_map.get(source_language, source_language or "eng")
-        tgt_lang = lang_map.get(target_language, target_language)
+        outputs = pipeline(inputs, batch_size=len(inputs), max_length=150, min_length=40, do_sample=False)
+        return [self._estimate_result("summary", text, out["summary_text"]) for text, out in zip(inputs, outputs)]
 
+    def _translate_batch(self, src_lang: str, tgt_lang: str, texts: List[str]) -> List[Dict[str, Any]]:
+        """Translate several texts for one language pair in one batched pipeline call."""
         try:
-            pipeline = self._get_translation_pipeline(src_lang, tgt_lang)
-            result = pipeline(text)
-            translation = result[0]["translation_text"]
+            pipeline, call_kwargs = self._get_translation_pipeline(src_lang, tgt_lang)
+            outputs = pipeline(texts, batch_size=len(texts), **call_kwargs)
+            translations = [out["translation_text"] for out in outputs]
         except Exception as e:
-            print(f"Translation error: {e}")
+            logger.error("Translation error: %s", e)
             # Fallback: return original text with note
-            translation = f"[Translation unavailable: {e}] {text}"
+            translations = [f"[Translation unavailable: {e}] {text}" for text in texts]
 
-        # Estimate token counts
-        prompt_tokens = len(text.split())
-        completion_tokens = len(translation.split())
-        total_tokens = prompt_tokens + completion_tokens
+        return [self._estimate_result("translation", text, out) for text, out in zip(texts, translations)]
 
-        return {
-            "translation": translation,
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-            "total_tokens": total_tokens,
-            "cost_usd": 0.0,  # Local models are free
-        }
+    @staticmethod
+    def _language_pair(target_language: str, source_language: Optional[str]) -> Tuple[str, str]:
+        """Source/target pair for a request (source defaults to English)."""
+        return source_language or "en", target_language
+
+    def summarize_text(self, text: str) -> Dict[str, Any]:
+        """Summarize text using HuggingFace model"""
+        return self._summarize_batch([text])[0]
+
+    def translate_text(self, text: str, target_language: str, source_language: Optional[str] = None) -> Dict[str, Any]:
+        """Translate text using HuggingFace model"""
+        src_lang, tgt_lang = self._language_pair(target_language, source_language)
+        return self._translate_batch(src_lang, tgt_lang, [text])[0]
+
+    async def asummarize_text(self, text: str) -> Dict[str, Any]:
+        """Summarize text, batched with other concurrent requests."""
+        return await self._summarize_batcher.submit(text)
+
+    async def atranslate_text(
+        self, text: str, target_language: str, source_language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Translate text, batched with other concurrent requests for the same language pair."""
+        src_lang, tgt_lang = self._language_pair(target_language, source_language)
+        batcher = self._translate_batchers.get((src_lang, tgt_lang))
+        if batcher is None:
+            batcher = self._translate_batchers[(src_lang, tgt_lang)] = MicroBatcher(
+                partial(self._translate_batch, src_lang, tgt_lang), self.batch_size, self.batch_wait_s
+            )
+        return await batcher.submit(text)
+
+    async def aclose(self) -> None:
+        """Stop the batchers' consumer tasks."""
+        for batcher in [self._summarize_batcher, *self._translate_batchers.values()]:
+            await batcher.aclose()
+
+
+# Adapters are shared process-wide so clients, connection pools, tokens and models are reused
+_adapters: Dict[Tuple, AIModelAdapter] = {}
+_adapters_lock = threading.Lock()
 
 
 def get_ai_adapter(
@@ -299,6 +905,8 @@ def get_ai_adapter(
 ) -> AIModelAdapter:
     """Factory function to get the appropriate AI adapter.
 
+    Adapters are cached, so repeated calls with the same configuration return the same instance.
+
     Args:
         endpoint: Azure OpenAI endpoint (optional, read from env if None)
         api_key: Azure OpenAI API key (optional, for legacy support)
@@ -312,7 +920,8 @@ def get_ai_adapter(
 
     if environment == "LOCAL":
         # Use HuggingFace models for local development
-        return HuggingFaceAdapter()
+        key = ("huggingface",)
+        factory = HuggingFaceAdapter
     else:
         # Use Azure OpenAI
         if endpoint is None:
@@ -327,9 +936,14 @@ def get_ai_adapter(
             # Use Azure AD if no API key is provided
             use_azure_ad = not bool(api_key)
 
-        return AzureOpenAIAdapter(
-            endpoint=endpoint,
-            deployment=deployment,
-            api_key=api_key if not use_azure_ad else None,
-            use_azure_ad=use_azure_ad,
+        api_key = api_key if not use_azure_ad else None
+        key = ("azure_openai", endpoint, deployment, use_azure_ad, api_key)
+        factory = partial(
+            AzureOpenAIAdapter, endpoint=endpoint, deployment=deployment, api_key=api_key, use_azure_ad=use_azure_ad
         )
+
+    with _adapters_lock:
+        adapter = _adapters.get(key)
+        if adapter is None:
+            adapter = _adapters[key] = factory()
+    return adapter
@@ -6,16 +6,61 @@ and error handling.
 """
 
 import asyncio
+import inspect
 import json
+import logging
 import os
 import signal
 import socket
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+
+    def dumps_json(data: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes (orjson fast path)"""
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    loads_json = orjson.loads
+
+except ImportError:
+
+    def dumps_json(data: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes"""
+        return json.dumps(data).encode("utf-8")
+
+    loads_json = json.loads
+
+# Encoding of events sent to the router ("json" or "msgpack"); the router accepts both
+WIRE_FORMAT = os.getenv("WIRE_FORMAT", "json").lower()
+
+if WIRE_FORMAT == "msgpack":
+    import msgpack
+
+    EVENT_CONTENT_TYPE = "application/msgpack"
+
+    def _msgpack_default(value: Any) -> Any:
+        """Convert numpy scalars (e.g. model confidences) to plain Python values"""
+        if hasattr(value, "item"):
+            return value.item()
+        raise TypeError(f"Cannot serialize {type(value).__name__} to msgpack")
+
+    def encode_event(event: dict) -> bytes:
+        """Serialize a router event to MessagePack bytes"""
+        return msgpack.packb(event, default=_msgpack_default, use_bin_type=True)
+
+else:
+    EVENT_CONTENT_TYPE = "application/json"
+    encode_event = dumps_json
+
 
 # Add parent directory to path for backend modules
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "speech-flow-backend"))
@@ -28,14 +73,34 @@ try:
     USE_ADAPTERS = True
 except ImportError:
     # Fallback to direct Azure imports if adapters not available
+    from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
     from azure.servicebus import ServiceBusMessage
     from azure.servicebus.aio import ServiceBusClient
     from azure.storage.blob import BlobServiceClient
 
     USE_ADAPTERS = False
 
+logger = logging.getLogger(__name__)
+
+_ONE_MS = timedelta(milliseconds=1)
+
+
+def _message_bytes(msg) -> bytes:
+    """Get the raw body of a received message without decoding it to str"""
+    body = msg.body
+    if isinstance(body, (bytes, bytearray)):
+        return body
+    # Service Bus exposes the body as an iterable of data sections
+    return b"".join(body)
+
+
+@lru_cache(maxsize=None)
+def _result_suffix(step_name: str) -> str:
+    """Result blob suffix for a step (a worker only ever sees a handful of step names)"""
+    return step_name.lower()
 
-@dataclass
+
+@dataclass(slots=True)
 class StepMetrics:
     """Metrics collected during step processing for performance analysis.
 
@@ -109,14 +174,17 @@ class StepMetrics:
             Dictionary with metrics, datetime values converted to ISO format
         """
         result = {}
-        for key, value in asdict(self).items():
-            if isinstance(value, datetime):
-                result[key] = value.isoformat()
-            elif value is not None:
-                result[key] = value
+        for key, is_datetime in _STEP_METRICS_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                result[key] = value.isoformat() if is_datetime else value
         return result
 
 
+# (field name, is datetime) pairs, resolved once so to_dict needs no per-call reflection
+_STEP_METRICS_FIELDS = tuple((field.name, field.type == Optional[datetime]) for field in fields(StepMetrics))
+
+
 class BaseWorker(ABC):
     """Base class for all workers in the speech processing pipeline.
 
@@ -135,6 +203,9 @@ class BaseWorker(ABC):
     # Cost per 1000 tokens for Azure OpenAI (configurable via env vars)
     COST_PER_1K_INPUT_TOKENS: float = float(os.getenv("AZURE_OPENAI_INPUT_COST", "0.01"))
     COST_PER_1K_OUTPUT_TOKENS: float = float(os.getenv("AZURE_OPENAI_OUTPUT_COST", "0.03"))
+    # Per-token rates, derived once so cost calculation is two multiplies
+    COST_PER_INPUT_TOKEN: float = COST_PER_1K_INPUT_TOKENS / 1000
+    COST_PER_OUTPUT_TOKEN: float = COST_PER_1K_OUTPUT_TOKENS / 1000
 
     def __init__(self, queue_name: str, step_name: str):
         """Initialize worker with queue and step configuration.
@@ -154,6 +225,37 @@ class BaseWorker(ABC):
         self.blob_container_results: str = os.getenv("BLOB_CONTAINER_RESULTS", "results")
         self.router_queue: str = os.getenv("ROUTER_QUEUE_NAME", "job-events")
 
+        # Storage clients are created on first use and reused for every message
+        self._storage = None
+        self._blob_service = None
+        self._container_clients: Dict[str, Any] = {}
+        # Set once the results container is known to exist (adapters keep their own record)
+        self._results_container_ready = False
+
+        # Result blobs known to exist (uploaded or seen by this worker), so redelivered
+        # messages skip the blob HEAD; bounded LRU, only positive results are cached
+        self.completed_cache_size: int = int(os.getenv("WORKER_COMPLETED_CACHE_SIZE", "4096"))
+        self._completed_results: "OrderedDict[str, None]" = OrderedDict()
+        self._completed_lock = threading.Lock()
+
+        # Router events from concurrent handlers are coalesced into one send per flush window
+        self.event_batch_size: int = int(os.getenv("WORKER_EVENT_BATCH_SIZE", "100"))
+        self.event_flush_s: float = int(os.getenv("WORKER_EVENT_FLUSH_MS", "20")) / 1000
+        self._event_queue: Optional[asyncio.Queue] = None
+
+        # Maximum messages processed concurrently (1 = serial, for model-bound workers)
+        self.max_concurrency: int = int(os.getenv("WORKER_CONCURRENCY", "1"))
+
+        # Service Bus prefetch buffer (None = match max_concurrency; serial workers don't prefetch,
+        # since a buffered message's lock keeps ticking while the current one is processed)
+        prefetch = os.getenv("WORKER_PREFETCH_COUNT")
+        self.prefetch_count: Optional[int] = int(prefetch) if prefetch else None
+
+        # Message locks are renewed at this fraction of their remaining time while a message is handled
+        # (fallback interval when the broker doesn't report lock expiry)
+        self.lock_renew_fraction: float = 0.6
+        self.lock_renew_interval_s: float = float(os.getenv("WORKER_LOCK_RENEW_SECONDS", "20"))
+
         # Database connection for idempotency checks
         self.db_url: str = os.getenv("DATABASE_URL", "")
 
@@ -162,9 +264,18 @@ class BaseWorker(ABC):
         self.worker_node: str = os.getenv("NODE_NAME", "unknown")
         self.worker_node_pool: str = os.getenv("NODE_POOL", "default")
 
-        # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGTERM, self._shutdown_handler)
-        signal.signal(signal.SIGINT, self._shutdown_handler)
+        # Pending receive call, cancelled on shutdown so the worker stops without waiting out max_wait_time
+        self._receive_task: Optional[asyncio.Future] = None
+
+    def _install_signal_handlers(self) -> None:
+        """Register SIGTERM/SIGINT on the running event loop for graceful shutdown."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, self._request_shutdown)
+            except NotImplementedError:
+                # Windows event loops have no add_signal_handler
+                signal.signal(sig, self._shutdown_handler)
 
     def _shutdown_handler(self, signum: int, frame: Any) -> None:
         """Handle shutdown signals for graceful termination.
@@ -173,8 +284,14 @@ class BaseWorker(ABC):
             signum: Signal number
             frame: Current stack frame
         """
-        print(f"Received shutdown signal. Finishing current job...")
+        self._request_shutdown()
+
+    def _request_shutdown(self) -> None:
+        """Stop receiving new messages; in-flight messages still finish and are settled."""
+        logger.info("Received shutdown signal. Finishing current job...")
         self.running = False
+        if self._receive_task is not None:
+            self._receive_task.cancel()
 
     def _now_utc(self) -> datetime:
         """Get current UTC timestamp.
@@ -192,11 +309,26 @@ class BaseWorker(ABC):
             completion_tokens: Number of tokens in the completion
 
         Returns:
-            Cost in USD, rounded to 6 decimal places
+            Cost in USD, unrounded (stored as NUMERIC(10, 6); round only for display)
         """
-        input_cost = (prompt_tokens / 1000) * self.COST_PER_1K_INPUT_TOKENS
-        output_cost = (completion_tokens / 1000) * self.COST_PER_1K_OUTPUT_TOKENS
-        return round(input_cost + output_cost, 6)
+        return prompt_tokens * self.COST_PER_INPUT_TOKEN + completion_tokens * self.COST_PER_OUTPUT_TOKEN
+
+    @property
+    def storage(self):
+        """Storage adapter (adapter path), resolved once per worker."""
+        if self._storage is None:
+            self._storage = get_storage_adapter(self.storage_conn_str)
+        return self._storage
+
+    def _get_container_client(self, container_name: str):
+        """Container client (direct SDK path) on a shared BlobServiceClient, created once per container."""
+        container_client = self._container_clients.get(container_name)
+        if container_client is None:
+            if self._blob_service is None:
+                self._blob_service = BlobServiceClient.from_connection_string(self.storage_conn_str)
+            container_client = self._blob_service.get_container_client(container_name)
+            self._container_clients[container_name] = container_client
+        return container_client
 
     def download_audio(self, blob_name: str, local_path: str) -> int:
         """Download audio file from blob storage.
@@ -209,79 +341,249 @@ class BaseWorker(ABC):
             Size of downloaded file in bytes
         """
         if USE_ADAPTERS:
-            storage = get_storage_adapter(self.storage_conn_str)
-            data = storage.download_blob(self.blob_container_raw, blob_name)
-        else:
-            blob_service_client = BlobServiceClient.from_connection_string(self.storage_conn_str)
-            blob_client = blob_service_client.get_blob_client(container=self.blob_container_raw, blob=blob_name)
-            data = blob_client.download_blob().readall()
+            return self.storage.download_blob_to_path(self.blob_container_raw, blob_name, local_path)
 
+        # Stream chunks straight into the file instead of holding the whole blob in memory
+        blob_client = self._get_container_client(self.blob_container_raw).get_blob_client(blob_name)
         with open(local_path, "wb") as download_file:
-            download_file.write(data)
-        return len(data)
+            return blob_client.download_blob().readinto(download_file)
+
+    def _remember_completed(self, blob_name: str) -> None:
+        """Record that a result blob exists."""
+        if self.completed_cache_size <= 0:
+            return
+        with self._completed_lock:
+            self._completed_results[blob_name] = None
+            self._completed_results.move_to_end(blob_name)
+            if len(self._completed_results) > self.completed_cache_size:
+                self._completed_results.popitem(last=False)
+
+    def _is_known_completed(self, blob_name: str) -> bool:
+        """Whether this worker has already seen the result blob."""
+        with self._completed_lock:
+            return blob_name in self._completed_results
+
+    def _ensure_results_container(self, container_client) -> None:
+        """Create the results container if needed (legacy SDK path)."""
+        # One create call instead of exists() + create, and safe when replicas race to create it
+        try:
+            container_client.create_container()
+        except ResourceExistsError:
+            pass
+        self._results_container_ready = True
 
     def upload_result(self, job_id: str, suffix: str, result_data: dict) -> str:
         """Upload result JSON to blob storage"""
         blob_name = f"{job_id}_{suffix}.json"
 
         if USE_ADAPTERS:
-            storage = get_storage_adapter(self.storage_conn_str)
-            storage.ensure_container(self.blob_container_results)
-            data = json.dumps(result_data).encode("utf-8")
-            storage.upload_blob(self.blob_container_results, blob_name, data, overwrite=True)
+            self.storage.ensure_container(self.blob_container_results)
+            self.storage.upload_blob(self.blob_container_results, blob_name, dumps_json(result_data), overwrite=True)
         else:
-            blob_service_client = BlobServiceClient.from_connection_string(self.storage_conn_str)
-            container_client = blob_service_client.get_container_client(self.blob_container_results)
-            if not container_client.exists():
-                container_client.create_container()
+            container_client = self._get_container_client(self.blob_container_results)
+            if not self._results_container_ready:
+                self._ensure_results_container(container_client)
 
             blob_client = container_client.get_blob_client(blob_name)
-            blob_client.upload_blob(json.dumps(result_data), overwrite=True)
-
+            try:
+                blob_client.upload_blob(dumps_json(result_data), overwrite=True)
+            except ResourceNotFoundError:
+                # Container was deleted while the worker was running: recreate it once and retry
+                self._results_container_ready = False
+                self._ensure_results_container(container_client)
+                blob_client.upload_blob(dumps_json(result_data), overwrite=True)
+
+        self._remember_completed(blob_name)
         return blob_name
 
-    def check_step_status(self, job_id: str) -> str:
+    # Async variants: storage IO runs in a worker thread so concurrent message
+    # handlers (and the event flusher) keep running while a transfer is in progress.
+
+    async def adownload_audio(self, blob_name: str, local_path: str) -> int:
+        """Async variant of download_audio."""
+        return await asyncio.to_thread(self.download_audio, blob_name, local_path)
+
+    async def aupload_result(self, job_id: str, suffix: str, result_data: dict) -> str:
+        """Async variant of upload_result."""
+        return await asyncio.to_thread(self.upload_result, job_id, suffix, result_data)
+
+    def _status_blob_name(self, job_id: str, step_name: Optional[str] = None) -> str:
+        """Result blob whose presence marks a step as completed"""
+        return f"{job_id}_{_result_suffix(step_name or self.step_name)}.json"
+
+    async def acheck_step_status(self, job_id: str, step_name: Optional[str] = None) -> str:
+        """Async variant of check_step_status (answered inline when the result is already known)."""
+        if self._is_known_completed(self._status_blob_name(job_id, step_name)):
+            return "COMPLETED"
+        return await asyncio.to_thread(self.check_step_status, job_id, step_name)
+
+    def get_step_name(self, payload: dict) -> str:
+        """Step name reported for a message; override when one worker serves several steps.
+
+        Args:
+            payload: Message payload from queue
+
+        Returns:
+            Step name used for idempotency checks and router events
+        """
+        return self.step_name
+
+    def check_step_status(self, job_id: str, step_name: Optional[str] = None) -> str:
         """Check if step is already processed (idempotency check)"""
         try:
-            blob_name = f"{job_id}_{self.step_name.lower()}.json"
+            blob_name = self._status_blob_name(job_id, step_name)
+            if self._is_known_completed(blob_name):
+                return "COMPLETED"
 
             if USE_ADAPTERS:
-                storage = get_storage_adapter(self.storage_conn_str)
-                if storage.blob_exists(self.blob_container_results, blob_name):
-                    return "COMPLETED"
+                exists = self.storage.blob_exists(self.blob_container_results, blob_name)
             else:
-                blob_service_client = BlobServiceClient.from_connection_string(self.storage_conn_str)
-                blob_client = blob_service_client.get_blob_client(container=self.blob_container_results, blob=blob_name)
-                if blob_client.exists():
-                    return "COMPLETED"
+                exists = self._get_container_client(self.blob_container_results).get_blob_client(blob_name).exists()
+            if exists:
+                self._remember_completed(blob_name)
+                return "COMPLETED"
         except:
             pass
         return "PENDING"
 
-    async def send_success(self, sb_client, job_id: str, result: dict, metrics: StepMetrics):
+    async def send_success(
+        self, sb_client, job_id: str, result: dict, metrics: StepMetrics, step_name: Optional[str] = None
+    ):
         """Send success event to router with metrics"""
         result_msg = {
             "job_id": job_id,
             "event": "STEP_COMPLETED",
-            "step_name": self.step_name,
+            "step_name": step_name or self.step_name,
             "result": result,
             "metrics": metrics.to_dict(),
         }
-        sender = sb_client.get_queue_sender(self.router_queue)
-        await sender.send_messages(ServiceBusMessage(json.dumps(result_msg)))
+        await self._publish_event(sb_client, result_msg)
 
-    async def send_failure(self, sb_client, job_id: str, error: str, metrics: StepMetrics):
+    async def send_failure(
+        self, sb_client, job_id: str, error: str, metrics: StepMetrics, step_name: Optional[str] = None
+    ):
         """Send failure event to router with metrics"""
         metrics.error_message = error
         fail_msg = {
             "job_id": job_id,
             "event": "STEP_FAILED",
-            "step_name": self.step_name,
+            "step_name": step_name or self.step_name,
             "error": error,
             "metrics": metrics.to_dict(),
         }
+        await self._publish_event(sb_client, fail_msg)
+
+    async def _get_router_sender(self, sb_client):
+        """Get a router queue sender from either a broker adapter (async) or a Service Bus client."""
         sender = sb_client.get_queue_sender(self.router_queue)
-        await sender.send_messages(ServiceBusMessage(json.dumps(fail_msg)))
+        if inspect.isawaitable(sender):
+            sender = await sender
+        return sender
+
+    @staticmethod
+    def _event_message(event: dict):
+        """Build the outgoing router message for an event in the configured wire format"""
+        return ServiceBusMessage(encode_event(event), content_type=EVENT_CONTENT_TYPE)
+
+    async def _publish_event(self, sb_client, event: dict) -> None:
+        """Send an event to the router, returning once it has been sent.
+
+        While the event flusher runs, the event joins the next batched send; callers still wait
+        for it, so the source message is only completed after its event is on the router queue.
+        """
+        # Encode here so serialization errors reach the caller instead of the flusher task
+        message = self._event_message(event)
+        if self._event_queue is None:
+            sender = await self._get_router_sender(sb_client)
+            await sender.send_messages(message)
+            return
+
+        sent = asyncio.get_running_loop().create_future()
+        await self._event_queue.put((message, sent))
+        await sent
+
+    async def _flush_events(self, sender) -> None:
+        """Send queued (message, future) pairs to the router in batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[Any, asyncio.Future]] = [await self._event_queue.get()]
+            deadline = loop.time() + self.event_flush_s
+            while len(batch) < self.event_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._event_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                for payload, items in await self._group_for_send(sender, batch):
+                    await self._send_event_group(sender, payload, items)
+            except Exception as e:
+                # Batching itself failed (e.g. create_message_batch): fail the batch's callers, keep flushing
+                logger.error("[%s] Router event batch failed: %s", self.step_name, e)
+                for _, sent in batch:
+                    if not sent.done():
+                        sent.set_exception(e)
+
+    @staticmethod
+    async def _group_for_send(sender, pending: List[Tuple[Any, asyncio.Future]]) -> List[Tuple[Any, list]]:
+        """Split outgoing messages into sends that fit the broker's batch size limit.
+
+        Args:
+            sender: Router queue sender
+            pending: (message, completion future) pairs in send order
+
+        Returns:
+            (payload, pending pairs) per send; the payload is a ServiceBusMessageBatch when the sender
+            can build one, otherwise the plain message list
+        """
+        create_batch = getattr(sender, "create_message_batch", None)
+        if create_batch is None:
+            return [([message for message, _ in pending], pending)]
+
+        groups = []
+        message_batch, items = await create_batch(), []
+        for message, sent in pending:
+            try:
+                message_batch.add_message(message)
+            except ValueError:
+                # Batch full: close it and start the next one
+                if items:
+                    groups.append((message_batch, items))
+                    message_batch, items = await create_batch(), []
+                try:
+                    message_batch.add_message(message)
+                except ValueError:
+                    # Larger than any batch: send it alone so the error reaches its handler
+                    groups.append(([message], [(message, sent)]))
+                    continue
+            items.append((message, sent))
+        if items:
+            groups.append((message_batch, items))
+        return groups
+
+    @staticmethod
+    async def _send_event_group(sender, payload, items: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Send one group of router events and resolve their futures."""
+        try:
+            await sender.send_messages(payload)
+        except Exception:
+            # Group rejected: send individually so one event can't sink the rest
+            for message, sent in items:
+                try:
+                    await sender.send_messages(message)
+                except Exception as e:
+                    if not sent.done():
+                        sent.set_exception(e)
+                else:
+                    if not sent.done():
+                        sent.set_result(None)
+        else:
+            for _, sent in items:
+                if not sent.done():
+                    sent.set_result(None)
 
     @abstractmethod
     async def process(self, job_id: str, payload: dict, metrics: StepMetrics, sb_client) -> dict:
@@ -301,8 +603,9 @@ class BaseWorker(ABC):
 
     async def handle_message(self, msg, sb_client):
         """Handle incoming message with metrics collection"""
-        body = json.loads(str(msg))
+        body = loads_json(_message_bytes(msg))
         job_id = body.get("job_id")
+        step_name = self.get_step_name(body)
 
         # Initialize metrics
         metrics = StepMetrics(
@@ -312,85 +615,176 @@ class BaseWorker(ABC):
             dequeued_at=self._now_utc(),
         )
 
-        # Extract queued_at from message if available
-        if "queued_at" in body:
+        # Queue wait from the router's epoch-ns stamp (integer math, no datetime parsing);
+        # messages from older routers only carry the ISO queued_at
+        queued_at_ns = body.get("queued_at_ns")
+        if isinstance(queued_at_ns, int):
+            metrics.queue_wait_ms = (time.time_ns() - queued_at_ns) // 1_000_000
+        elif "queued_at" in body:
             try:
                 metrics.queued_at = datetime.fromisoformat(body["queued_at"])
-            except:
+            except (TypeError, ValueError):
                 pass
 
-        # Calculate queue wait time
-        if metrics.queued_at and metrics.dequeued_at:
-            delta = metrics.dequeued_at - metrics.queued_at
-            metrics.queue_wait_ms = int(delta.total_seconds() * 1000)
+            # Calculate queue wait time
+            if metrics.queued_at and metrics.dequeued_at:
+                delta = metrics.dequeued_at - metrics.queued_at
+                metrics.queue_wait_ms = delta // _ONE_MS
 
-        print(f"[{self.step_name}] Processing Job {job_id} (queue wait: {metrics.queue_wait_ms}ms)")
+        logger.info("[%s] Processing Job %s (queue wait: %sms)", step_name, job_id, metrics.queue_wait_ms)
 
         # Idempotency check
-        status = self.check_step_status(job_id)
+        status = await self.acheck_step_status(job_id, step_name)
         if status == "COMPLETED":
-            print(f"[{self.step_name}] Job {job_id} already processed. Skipping.")
+            logger.info("[%s] Job %s already processed. Skipping.", step_name, job_id)
             return
 
         # Start processing
         metrics.started_at = self._now_utc()
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
 
         try:
             result = await self.process(job_id, body, metrics, sb_client)
 
             # Record completion time
             metrics.completed_at = self._now_utc()
-            metrics.processing_duration_ms = int((time.perf_counter() - start_time) * 1000)
+            metrics.processing_duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
-            print(f"[{self.step_name}] Job {job_id} completed in {metrics.processing_duration_ms}ms")
-            await self.send_success(sb_client, job_id, result, metrics)
+            logger.info("[%s] Job %s completed in %dms", step_name, job_id, metrics.processing_duration_ms)
+            await self.send_success(sb_client, job_id, result, metrics, step_name)
 
         except Exception as e:
             metrics.completed_at = self._now_utc()
-            metrics.processing_duration_ms = int((time.perf_counter() - start_time) * 1000)
+            metrics.processing_duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Set error code if not already set by subclass
             if not metrics.error_code:
                 metrics.error_code = type(e).__name__
 
-            print(f"[{self.step_name}] Error: {e}")
-            await self.send_failure(sb_client, job_id, str(e), metrics)
+            logger.error("[%s] Error: %s", step_name, e)
+            await self.send_failure(sb_client, job_id, str(e), metrics, step_name)
+
+    async def _renew_lock(self, receiver, msg) -> None:
+        """Keep a message's lock alive until cancelled (i.e. until the message is settled)."""
+        while True:
+            locked_until = getattr(msg, "locked_until_utc", None)
+            if locked_until is not None:
+                if locked_until.tzinfo is None:
+                    locked_until = locked_until.replace(tzinfo=timezone.utc)
+                remaining = (locked_until - self._now_utc()).total_seconds()
+                delay = max(remaining * self.lock_renew_fraction, 1.0)
+            else:
+                delay = self.lock_renew_interval_s
+            await asyncio.sleep(delay)
+
+            try:
+                await receiver.renew_message_lock(msg)
+            except Exception as e:
+                # Lock already lost; the message will be redelivered and skipped by the idempotency check
+                logger.warning("[%s] Lock renewal failed: %s", self.step_name, e)
+                return
+
+    async def _handle_and_complete(self, receiver, msg, sb_client) -> None:
+        """Handle one message and settle it; errors are logged so sibling tasks keep running."""
+        # Brokers without message locks (RabbitMQ) have nothing to renew
+        renewer = None
+        if hasattr(receiver, "renew_message_lock"):
+            renewer = asyncio.create_task(self._renew_lock(receiver, msg))
+        try:
+            await self.handle_message(msg, sb_client)
+            await receiver.complete_message(msg)
+        except Exception as e:
+            logger.error("[%s] Message error: %s", self.step_name, e)
+        finally:
+            if renewer is not None:
+                renewer.cancel()
+
+    async def _receive_loop(self, receiver, sb_client) -> None:
+        """Receive and process messages with up to max_concurrency in flight."""
+        # One sender for the worker's lifetime; events are flushed in batches
+        sender = await self._get_router_sender(sb_client)
+        async with sender:
+            self._event_queue = asyncio.Queue()
+            flusher = asyncio.create_task(self._flush_events(sender))
+            try:
+                await self._process_messages(receiver, sb_client)
+            finally:
+                # Handlers have finished and awaited their events, so nothing is left to flush
+                flusher.cancel()
+                self._event_queue = None
+
+    async def _process_messages(self, receiver, sb_client) -> None:
+        """Receive messages and handle them as tasks, keeping up to max_concurrency in flight."""
+        in_flight = set()
+        while self.running:
+            try:
+                free_slots = self.max_concurrency - len(in_flight)
+                if free_slots <= 0:
+                    # At capacity: wait for a slot instead of pulling (and locking) more messages
+                    await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                # Receive with a timeout to re-check self.running; shutdown also cancels the wait
+                self._receive_task = asyncio.ensure_future(
+                    receiver.receive_messages(max_message_count=free_slots, max_wait_time=5)
+                )
+                try:
+                    messages = await self._receive_task
+                except asyncio.CancelledError:
+                    if self.running:
+                        raise
+                    break
+                finally:
+                    self._receive_task = None
+                for msg in messages:
+                    task = asyncio.create_task(self._handle_and_complete(receiver, msg, sb_client))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+            except Exception as e:
+                logger.error("[%s] Loop error: %s", self.step_name, e)
+                await asyncio.sleep(1)
+
+        # Let in-flight messages finish before the receiver closes
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    def _open_client(self):
+        """Message broker client (an async context manager) for the configured backend."""
+        if USE_ADAPTERS:
+            return get_message_broker(self.servicebus_conn_str)
+        return ServiceBusClient.from_connection_string(self.servicebus_conn_str)
+
+    async def _open_receiver(self, client, prefetch_count: int):
+        """Get the work queue receiver (adapters create it asynchronously, the SDK synchronously)."""
+        receiver = client.get_queue_receiver(queue_name=self.queue_name, prefetch_count=prefetch_count)
+        if inspect.isawaitable(receiver):
+            receiver = await receiver
+        return receiver
+
+    async def shutdown(self) -> None:
+        """Release worker resources once the receive loop has stopped. Override in subclasses."""
 
     async def run(self):
         """Main worker loop"""
-        print(f"[{self.step_name}] Worker starting on queue: {self.queue_name}")
-        print(
-            f"[{self.step_name}] Worker ID: {self.worker_id}, Node: {self.worker_node}, Pool: {self.worker_node_pool}"
+        logger.info("[%s] Worker starting on queue: %s", self.step_name, self.queue_name)
+        logger.info(
+            "[%s] Worker ID: %s, Node: %s, Pool: %s",
+            self.step_name,
+            self.worker_id,
+            self.worker_node,
+            self.worker_node_pool,
         )
+        logger.info("[%s] Max concurrent messages: %d", self.step_name, self.max_concurrency)
 
-        if USE_ADAPTERS:
-            async with get_message_broker(self.servicebus_conn_str) as client:
-                receiver = await client.get_queue_receiver(queue_name=self.queue_name)
-                async with receiver:
-                    while self.running:
-                        try:
-                            # Use receive with timeout to allow checking self.running
-                            messages = await receiver.receive_messages(max_message_count=1, max_wait_time=5)
-                            for msg in messages:
-                                await self.handle_message(msg, client)
-                                await receiver.complete_message(msg)
-                        except Exception as e:
-                            print(f"[{self.step_name}] Loop error: {e}")
-                            await asyncio.sleep(1)
-        else:
-            async with ServiceBusClient.from_connection_string(self.servicebus_conn_str) as client:
-                receiver = client.get_queue_receiver(queue_name=self.queue_name)
-                async with receiver:
-                    while self.running:
-                        try:
-                            # Use receive with timeout to allow checking self.running
-                            messages = await receiver.receive_messages(max_message_count=1, max_wait_time=5)
-                            for msg in messages:
-                                await self.handle_message(msg, client)
-                                await receiver.complete_message(msg)
-                        except Exception as e:
-                            print(f"[{self.step_name}] Loop error: {e}")
-                            await asyncio.sleep(1)
-
-        print(f"[{self.step_name}] Worker shutdown complete.")
+        prefetch_count = self.prefetch_count
+        if prefetch_count is None:
+            prefetch_count = self.max_concurrency if self.max_concurrency > 1 else 0
+
+        self._install_signal_handlers()
+        async with self._open_client() as client:
+            receiver = await self._open_receiver(client, prefetch_count)
+            async with receiver:
+                await self._receive_loop(receiver, client)
+
+        await self.shutdown()
+        logger.info("[%s] Worker shutdown complete.", self.step_name)
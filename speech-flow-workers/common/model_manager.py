@@ -11,7 +11,9 @@ This module provides centralized model management for all workers including:
 
 import logging
 import os
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional, Tuple
 
@@ -36,6 +38,8 @@ class ModelConfig:
     # Download retry configuration
     MAX_RETRIES = int(os.getenv("MODEL_DOWNLOAD_MAX_RETRIES", "3"))
     RETRY_DELAY = int(os.getenv("MODEL_DOWNLOAD_RETRY_DELAY", "5"))  # seconds
+    # Randomize each backoff between half and the full delay so pods rolled out together don't retry in lockstep
+    RETRY_JITTER = os.getenv("MODEL_DOWNLOAD_JITTER", "true").lower() == "true"
 
     # Model version configuration
     WHISPER_MODEL_NAME = os.getenv("WHISPER_MODEL_NAME", "large-v3")
@@ -85,7 +89,9 @@ class ModelManager:
                     raise
 
                 wait_time = self.config.RETRY_DELAY * (2 ** (attempt - 1))
-                logger.warning(f"Attempt {attempt} failed: {e}. Retrying in {wait_time}s...")
+                if self.config.RETRY_JITTER:
+                    wait_time = random.uniform(wait_time / 2, wait_time)
+                logger.warning(f"Attempt {attempt} failed: {e}. Retrying in {wait_time:.1f}s...")
                 time.sleep(wait_time)
 
     def load_whisper_model(self) -> Tuple[Any, dict]:
@@ -152,8 +158,12 @@ class ModelManager:
                 cache_dir=self.config.TRANSFORMERS_CACHE,
             )
 
-        processor = self._retry_with_backoff(_load_processor)
-        model = self._retry_with_backoff(_load_model)
+        # Processor and weights are independent downloads; fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            processor_future = executor.submit(self._retry_with_backoff, _load_processor)
+            model_future = executor.submit(self._retry_with_backoff, _load_model)
+            processor = processor_future.result()
+            model = model_future.result()
 
         metadata = {
             "model_name": self.config.LID_MODEL_ID,
@@ -222,12 +232,19 @@ class ModelManager:
         """
 
         def get_dir_size(path):
-            """Calculate total size of directory"""
+            """Calculate total size of directory (symlinks, e.g. HF snapshot links to blobs, are not counted)"""
             total = 0
+            pending = [path]
             try:
-                for entry in Path(path).rglob("*"):
-                    if entry.is_file():
-                        total += entry.stat().st_size
+                while pending:
+                    with os.scandir(pending.pop()) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total += entry.stat(follow_symlinks=False).st_size
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.warning(f"Error calculating size for {path}: {e}")
             return total
@@ -15,6 +15,7 @@ Usage:
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -60,13 +61,21 @@ def main():
     if not (args.whisper or args.lid):
         args.all = True
 
+    # Whisper and LID are independent downloads: fetch them concurrently, then report in order
+    loaders = {}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if args.all or args.whisper:
+            loaders["whisper"] = executor.submit(model_manager.load_whisper_model)
+        if args.all or args.lid:
+            loaders["lid"] = executor.submit(model_manager.load_lid_model)
+
     success = True
 
     # Download Whisper model
-    if args.all or args.whisper:
+    if "whisper" in loaders:
         print("\n=== Downloading Whisper Model ===")
         try:
-            model, metadata = model_manager.load_whisper_model()
+            model, metadata = loaders["whisper"].result()
             if model_manager.validate_whisper_model(model):
                 print(f"✓ Whisper model successfully loaded and validated")
                 print(f"  Model: {metadata['model_name']}")
@@ -80,10 +89,10 @@ def main():
             success = False
 
     # Download LID model
-    if args.all or args.lid:
+    if "lid" in loaders:
         print("\n=== Downloading LID Model ===")
         try:
-            processor, model, metadata = model_manager.load_lid_model()
+            processor, model, metadata = loaders["lid"].result()
             if model_manager.validate_lid_model(processor, model):
                 print(f"✓ LID model successfully loaded and validated")
                 print(f"  Model: {metadata['model_name']}")
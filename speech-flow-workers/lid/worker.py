@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import os
 import sys
 
@@ -8,8 +9,11 @@ import torchaudio
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from common.base_worker import BaseWorker, StepMetrics
+from common.logging_config import configure_queue_logging
 from common.model_manager import get_model_manager
 
+logger = logging.getLogger("lid")
+
 # Load Model (Global to avoid reloading)
 print("Loading MMS LID Model...")
 model_manager = get_model_manager()
@@ -75,17 +79,18 @@ class LIDWorker(BaseWorker):
 
         try:
             # Download audio
-            self.download_audio(f"{job_id}.wav", local_filename)
+            await self.adownload_audio(f"{job_id}.wav", local_filename)
 
             # Run inference
-            lang_code, confidence, audio_duration = self.identify_language(local_filename)
+            # Inference runs in a thread so the event loop keeps renewing the message lock
+            lang_code, confidence, audio_duration = await asyncio.to_thread(self.identify_language, local_filename)
 
             # Record LID-specific metrics
             metrics.detected_language = lang_code
             metrics.language_confidence = round(confidence, 4)
             metrics.audio_duration_seconds = round(audio_duration, 2)
 
-            print(f"[LID] Detected Language: {lang_code} (confidence: {confidence:.3f})")
+            logger.info("Detected Language: %s (confidence: %.3f)", lang_code, confidence)
 
             return {
                 "language": lang_code,
@@ -101,5 +106,10 @@ class LIDWorker(BaseWorker):
 
 
 if __name__ == "__main__":
-    worker = LIDWorker()
-    asyncio.run(worker.run())
+    # Log writes happen on a background thread so concurrent handlers never block on stdout
+    log_listener = configure_queue_logging()
+    try:
+        worker = LIDWorker()
+        asyncio.run(worker.run())
+    finally:
+        log_listener.stop()
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import os
 import sys
 import time
@@ -6,8 +7,11 @@ import time
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from common.base_worker import BaseWorker, StepMetrics
+from common.logging_config import configure_queue_logging
 from common.model_manager import get_model_manager
 
+logger = logging.getLogger("whisper")
+
 # Load Model (Global to avoid reloading)
 print("Loading Whisper V3 Large Model...")
 model_manager = get_model_manager()
@@ -65,11 +69,14 @@ class WhisperWorker(BaseWorker):
 
         try:
             # Download audio
-            self.download_audio(f"{job_id}.wav", local_filename)
+            await self.adownload_audio(f"{job_id}.wav", local_filename)
 
             # Run transcription with timing for RTF calculation
             transcribe_start = time.perf_counter()
-            text, segments, audio_duration, word_count, char_count = self.transcribe(local_filename, language)
+            # Inference runs in a thread so the event loop keeps renewing the message lock
+            text, segments, audio_duration, word_count, char_count = await asyncio.to_thread(
+                self.transcribe, local_filename, language
+            )
             transcribe_time = time.perf_counter() - transcribe_start
 
             # Calculate Real-Time Factor (RTF = processing_time / audio_duration)
@@ -82,7 +89,7 @@ class WhisperWorker(BaseWorker):
             metrics.transcript_char_count = char_count
             metrics.transcription_rtf = round(rtf, 3)
 
-            print(f"[WHISPER] Transcription complete. {word_count} words, {char_count} chars, RTF: {rtf:.3f}")
+            logger.info("Transcription complete. %d words, %d chars, RTF: %.3f", word_count, char_count, rtf)
 
             # Save full result to blob
             result_data = {
@@ -95,7 +102,7 @@ class WhisperWorker(BaseWorker):
                 "char_count": char_count,
                 "rtf": round(rtf, 3),
             }
-            blob_path = self.upload_result(job_id, "transcript", result_data)
+            blob_path = await self.aupload_result(job_id, "transcript", result_data)
 
             return {
                 "blob_path": blob_path,
@@ -112,5 +119,10 @@ class WhisperWorker(BaseWorker):
 
 
 if __name__ == "__main__":
-    worker = WhisperWorker()
-    asyncio.run(worker.run())
+    # Log writes happen on a background thread so concurrent handlers never block on stdout
+    log_listener = configure_queue_logging()
+    try:
+        worker = WhisperWorker()
+        asyncio.run(worker.run())
+    finally:
+        log_listener.stop()
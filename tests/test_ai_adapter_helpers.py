@@ -0,0 +1,253 @@
+import asyncio
+import os
+import sys
+import threading
+import unittest
+from types import SimpleNamespace
+
+# Add workers to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "speech-flow-workers"))
+
+from common.ai_adapter import (
+    SUMMARIZE_USER_PREFIX,
+    AzureOpenAIAdapter,
+    MicroBatcher,
+    ResponseCache,
+    count_tokens,
+    split_text,
+)
+
+
+class TestSplitText(unittest.TestCase):
+
+    def test_short_text_is_a_single_chunk(self):
+        """Test that text within the budget is returned unchanged."""
+        self.assertEqual(split_text("One sentence. Another one.", 1000), ["One sentence. Another one."])
+
+    def test_chunks_round_trip_and_respect_token_limit(self):
+        """Test that chunks break on sentence boundaries, stay within budget and re-join to the input."""
+        text = " ".join(f"Sentence number {i} talks about the weather today." for i in range(200))
+        chunks = split_text(text, 50)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(" ".join(chunks), text)
+        self.assertTrue(all(chunk.endswith(".") for chunk in chunks))
+        self.assertTrue(all(count_tokens(chunk) <= 50 for chunk in chunks))
+
+    def test_oversized_sentence_is_hard_split(self):
+        """Test that a single sentence longer than the budget is split into in-budget pieces."""
+        text = "word " * 500
+        chunks = split_text(text, 40)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(count_tokens(chunk) <= 40 for chunk in chunks))
+        self.assertEqual("".join(chunks).replace(" ", ""), text.replace(" ", ""))
+
+    def test_whitespace_only_text_has_no_chunks(self):
+        """Test that blank input produces no empty chunks."""
+        self.assertEqual(split_text("   \n  ", 10), [])
+
+
+class _Completions:
+    """Fake chat.completions recording each prompt and its parameters, answering with summarize(text)."""
+
+    def __init__(self, summarize, finish_reason="stop"):
+        self.summarize = summarize
+        self.finish_reason = finish_reason
+        self.prompts = []
+        self.params = []
+
+    def _respond(self, messages, **params):
+        text = messages[-1]["content"]
+        self.prompts.append(text)
+        self.params.append(params)
+        return SimpleNamespace(
+            choices=[
+                SimpleNamespace(message=SimpleNamespace(content=self.summarize(text)), finish_reason=self.finish_reason)
+            ],
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        )
+
+    def create(self, messages, **params):
+        return self._respond(messages, **params)
+
+
+class _AsyncCompletions(_Completions):
+    async def create(self, messages, **params):
+        return self._respond(messages, **params)
+
+
+class TestChunkedSummary(unittest.TestCase):
+
+    def adapter(self, completions):
+        adapter = AzureOpenAIAdapter(endpoint="https://example.openai.azure.com", deployment="gpt-4", api_key="key")
+        adapter.cache = ResponseCache(0)
+        adapter.max_input_tokens = 60
+        adapter.chunk_tokens = 40
+        adapter._chunk_summary_params = {"max_tokens": 30}
+        client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        adapter._client = adapter._async_client = client
+        return adapter
+
+    def transcript(self):
+        return " ".join(f"Sentence number {i} talks about the weather today." for i in range(100))
+
+    def assert_prompts_within_budget(self, completions, adapter):
+        for prompt in completions.prompts:
+            self.assertLessEqual(count_tokens(prompt.removeprefix(SUMMARIZE_USER_PREFIX)), adapter.max_input_tokens)
+
+    def test_summaries_reduced_until_they_fit(self):
+        """Test that chunk summaries too long for one call are reduced in further rounds."""
+        completions = _Completions(lambda text: "A summary of this part of the text, about twenty tokens long.")
+        adapter = self.adapter(completions)
+        result = adapter.summarize_text(self.transcript())
+
+        chunk_count = len(split_text(self.transcript(), adapter.chunk_tokens))
+        # More calls than one map round plus a single reduce
+        self.assertGreater(len(completions.prompts), chunk_count + 1)
+        self.assert_prompts_within_budget(completions, adapter)
+        self.assertEqual(result["prompt_tokens"], 10 * len(completions.prompts))
+
+    def test_async_summaries_reduced_until_they_fit(self):
+        """Test that asummarize_text applies the same reduce rounds."""
+        completions = _AsyncCompletions(lambda text: "A summary of this part of the text, about twenty tokens long.")
+        adapter = self.adapter(completions)
+        result = asyncio.run(adapter.asummarize_text(self.transcript()))
+
+        self.assert_prompts_within_budget(completions, adapter)
+        self.assertEqual(result["summary"], "A summary of this part of the text, about twenty tokens long.")
+
+    def test_only_chunk_summaries_are_capped(self):
+        """Test that max_tokens applies to chunk summaries but not to the final or a short summary."""
+        completions = _Completions(lambda text: "A short summary.")
+        adapter = self.adapter(completions)
+
+        adapter.summarize_text(self.transcript())
+        self.assertTrue(all(params.get("max_tokens") == 30 for params in completions.params[:-1]))
+        self.assertNotIn("max_tokens", completions.params[-1])
+
+        adapter.summarize_text("A short transcript.")
+        self.assertNotIn("max_tokens", completions.params[-1])
+
+    def test_truncated_summary_is_logged(self):
+        """Test that a response cut off at max_tokens logs a warning."""
+        adapter = self.adapter(_Completions(lambda text: "A summary that", finish_reason="length"))
+        with self.assertLogs("common.ai_adapter", level="WARNING") as logs:
+            adapter.summarize_text("A short transcript.")
+        self.assertIn("truncated", logs.output[-1])
+
+    def test_non_shrinking_summaries_raise(self):
+        """Test that summaries as long as their input fail instead of looping."""
+        adapter = self.adapter(_Completions(lambda text: text.removeprefix(SUMMARIZE_USER_PREFIX)))
+        with self.assertRaises(ValueError):
+            adapter.summarize_text(self.transcript())
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def result(self, text):
+        return {"summary": text, "prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15, "cost_usd": 0.1}
+
+    def test_hit_reports_zero_usage(self):
+        """Test that a cache hit keeps the output but reports no tokens or cost."""
+        cache = ResponseCache(max_entries=4)
+        key = ResponseCache.make_key("summarize", "gpt-4", "text")
+        cache.put(key, self.result("short"))
+
+        hit = cache.get(key)
+        self.assertEqual(hit["summary"], "short")
+        self.assertEqual((hit["prompt_tokens"], hit["completion_tokens"], hit["total_tokens"]), (0, 0, 0))
+        self.assertEqual(hit["cost_usd"], 0.0)
+        self.assertTrue(hit["cache_hit"])
+
+        # The stored entry keeps its original usage
+        self.assertEqual(cache.get(key)["summary"], "short")
+        self.assertNotIn("cache_hit", cache._entries[key])
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that a full cache evicts the entry read or written longest ago."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", self.result("a"))
+        cache.put("b", self.result("b"))
+        cache.get("a")
+        cache.put("c", self.result("c"))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_zero_size_disables_caching(self):
+        """Test that max_entries=0 stores nothing."""
+        cache = ResponseCache(max_entries=0)
+        cache.put("a", self.result("a"))
+        self.assertIsNone(cache.get("a"))
+
+
+
+class TestMicroBatcher(unittest.TestCase):
+
+    def test_concurrent_requests_share_a_batch(self):
+        """Test that requests arriving together are run in one call and each gets its own result."""
+        calls = []
+
+        def run_batch(items):
+            calls.append(list(items))
+            return [item * 2 for item in items]
+
+        async def run():
+            batcher = MicroBatcher(run_batch, max_batch_size=8, max_wait_s=0.05)
+            return await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+        self.assertEqual(asyncio.run(run()), [0, 2, 4, 6, 8])
+        self.assertEqual(calls, [[0, 1, 2, 3, 4]])
+
+    def test_batches_are_capped_at_max_batch_size(self):
+        """Test that a full batch is flushed without waiting for max_wait_s."""
+        calls = []
+
+        def run_batch(items):
+            calls.append(len(items))
+            return items
+
+        async def run():
+            batcher = MicroBatcher(run_batch, max_batch_size=2, max_wait_s=5)
+            return await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(4))), 2)
+
+        self.assertEqual(asyncio.run(run()), [0, 1, 2, 3])
+        self.assertEqual(calls, [2, 2])
+
+    def test_batch_failure_reaches_every_caller(self):
+        """Test that an exception from run_batch is raised in each waiting request."""
+        batch_thread = []
+
+        def run_batch(items):
+            batch_thread.append(threading.current_thread())
+            raise RuntimeError("model unavailable")
+
+        async def run():
+            batcher = MicroBatcher(run_batch, max_batch_size=4, max_wait_s=0.01)
+            return await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertIsNot(batch_thread[0], threading.main_thread())
+
+
+    def test_aclose_stops_the_consumer(self):
+        """Test that aclose cancels the consumer task and a later submit restarts it."""
+
+        async def run():
+            batcher = MicroBatcher(lambda items: items, max_batch_size=4, max_wait_s=0.01)
+            self.assertEqual(await batcher.submit("a"), "a")
+            consumer = batcher._consumer
+            await batcher.aclose()
+            self.assertTrue(consumer.cancelled())
+            self.assertEqual(await batcher.submit("b"), "b")
+            await batcher.aclose()
+            return asyncio.all_tasks() - {asyncio.current_task()}
+
+        self.assertEqual(asyncio.run(run()), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
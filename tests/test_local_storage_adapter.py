@@ -0,0 +1,159 @@
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "speech-flow-backend"))
+
+from storage_adapter import (
+    _ADAPTER_ENV_VARS,
+    LocalFileStorageAdapter,
+    StorageConfig,
+    get_storage_adapter,
+    resolve_storage_config,
+)
+
+
+class TestLocalFileStorageAdapter(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_path = self._tmp.name
+        self.storage = LocalFileStorageAdapter(os.path.join(self.base_path, "storage"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_upload_and_download_round_trip(self):
+        """Test that uploaded bytes are returned unchanged."""
+        self.storage.upload_blob("results", "job_summary.json", b'{"summary": "ok"}')
+        self.assertTrue(self.storage.blob_exists("results", "job_summary.json"))
+        self.assertEqual(self.storage.download_blob("results", "job_summary.json"), b'{"summary": "ok"}')
+
+    def test_blob_exists_does_not_create_directories(self):
+        """Test that existence checks are read-only."""
+        self.assertFalse(self.storage.blob_exists("missing", "job/result.json"))
+        self.assertFalse(os.path.exists(os.path.join(self.storage.base_path, "missing")))
+
+    def test_path_transfers(self):
+        """Test file-to-file upload and download helpers."""
+        src = os.path.join(self.base_path, "input.wav")
+        with open(src, "wb") as f:
+            f.write(b"\x00\x01" * 4096)
+
+        self.storage.upload_blob_from_path("raw-audio", "job/input.wav", src)
+        dst = os.path.join(self.base_path, "output.wav")
+        size = self.storage.download_blob_to_path("raw-audio", "job/input.wav", dst)
+
+        self.assertEqual(size, 8192)
+        with open(dst, "rb") as f:
+            self.assertEqual(f.read(), b"\x00\x01" * 4096)
+
+    def test_stream_transfers(self):
+        """Test stream upload and download helpers."""
+        payload = b"chunk" * 10000
+        self.storage.upload_stream("raw-audio", "job/stream.wav", io.BytesIO(payload), length=len(payload))
+
+        out = io.BytesIO()
+        size = self.storage.download_to_stream("raw-audio", "job/stream.wav", out)
+
+        self.assertEqual(size, len(payload))
+        self.assertEqual(out.getvalue(), payload)
+
+    def test_upload_stream_from_file(self):
+        """Test that file-backed streams are copied from their current position."""
+        src = os.path.join(self.base_path, "input.wav")
+        with open(src, "wb") as f:
+            f.write(b"HEADER" + b"\x00\x01" * 4096)
+
+        with open(src, "rb") as f:
+            f.read(6)
+            self.storage.upload_stream("raw-audio", "job/body.wav", f)
+            self.assertEqual(f.read(), b"")
+
+        self.assertEqual(self.storage.download_blob("raw-audio", "job/body.wav"), b"\x00\x01" * 4096)
+
+    def test_upload_from_path_without_overwrite(self):
+        """Test that overwrite=False refuses to replace an existing blob."""
+        src = os.path.join(self.base_path, "input.wav")
+        with open(src, "wb") as f:
+            f.write(b"audio")
+
+        self.storage.upload_blob_from_path("raw-audio", "input.wav", src)
+        with self.assertRaises(FileExistsError):
+            self.storage.upload_blob_from_path("raw-audio", "input.wav", src, overwrite=False)
+
+    def test_generate_upload_urls_batch(self):
+        """Test that batch URL generation matches the single-blob variant."""
+        urls = self.storage.generate_upload_urls("results", ["job_lid.json", "job_summary.json"])
+
+        self.assertEqual(list(urls), ["job_lid.json", "job_summary.json"])
+        self.assertEqual(urls["job_lid.json"], self.storage.generate_upload_url("results", "job_lid.json"))
+
+    def test_async_variants(self):
+        """Test that async wrappers round-trip through the sync implementation."""
+
+        async def round_trip():
+            await self.storage.aupload_blob("results", "job_lid.json", b"{}")
+            exists = await self.storage.ablob_exists("results", "job_lid.json")
+            data = await self.storage.adownload_blob("results", "job_lid.json")
+            return exists, data
+
+        self.assertEqual(asyncio.run(round_trip()), (True, b"{}"))
+
+    def test_async_upload_stream_passes_options(self):
+        """Test that aupload_stream forwards length and overwrite to upload_stream."""
+        payload = b"RIFF" + b"\x01" * 1024
+        asyncio.run(self.storage.aupload_stream("raw-audio", "job/a.wav", io.BytesIO(payload), length=len(payload)))
+        self.assertEqual(self.storage.download_blob("raw-audio", "job/a.wav"), payload)
+
+        with self.assertRaises(FileExistsError):
+            asyncio.run(self.storage.aupload_stream("raw-audio", "job/a.wav", io.BytesIO(b"new"), overwrite=False))
+        self.assertEqual(self.storage.download_blob("raw-audio", "job/a.wav"), payload)
+
+    def test_factory_reuses_adapter_per_configuration(self):
+        """Test that get_storage_adapter caches instances per environment."""
+        other_path = os.path.join(self.base_path, "other")
+        env = {"ENVIRONMENT": "LOCAL", "USE_CLOUD_RESOURCES": "false", "AZURE_STORAGE_CONNECTION_STRING": ""}
+
+        with patch.dict(os.environ, dict(env, LOCAL_STORAGE_PATH=self.base_path)):
+            first = get_storage_adapter()
+            self.assertIs(get_storage_adapter(), first)
+        with patch.dict(os.environ, dict(env, LOCAL_STORAGE_PATH=other_path)):
+            self.assertIsNot(get_storage_adapter(), first)
+
+
+class TestResolveStorageConfig(unittest.TestCase):
+
+    def resolve(self, env, account_url=None, connection_string=None):
+        return resolve_storage_config(
+            account_url, connection_string, tuple(env.get(name) for name in _ADAPTER_ENV_VARS)
+        )
+
+    def test_azurite_connection_string(self):
+        """Test that an Azurite connection string selects connection-string access."""
+        conn = "DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;BlobEndpoint=http://azurite:10000/x"
+        config = self.resolve({"ENVIRONMENT": "LOCAL"}, connection_string=conn)
+
+        self.assertEqual(config, StorageConfig("connection_string", connection_string=conn))
+
+    def test_service_principal_account_name(self):
+        """Test that the account URL is derived from the account name for SPN access."""
+        env = {
+            "ENVIRONMENT": "AZURE",
+            "AZURE_CLIENT_ID": "id",
+            "AZURE_CLIENT_SECRET": "secret",
+            "AZURE_TENANT_ID": "tenant",
+            "AZURE_STORAGE_ACCOUNT_NAME": "acct",
+        }
+        config = self.resolve(env)
+
+        self.assertEqual(config, StorageConfig("account_url", account_url="https://acct.blob.core.windows.net"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import asyncio
+import os
+import sys
+import unittest
+
+# Add workers to path (BaseWorker adds the backend adapters itself)
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "speech-flow-workers"))
+
+from common.base_worker import BaseWorker
+
+
+class _Worker(BaseWorker):
+    """Minimal concrete worker for exercising BaseWorker plumbing."""
+
+    def __init__(self):
+        super().__init__(queue_name="test-jobs", step_name="TEST")
+        self.event_flush_s = 0.01
+
+    async def process(self, job_id, payload, metrics, sb_client):
+        return {}
+
+
+class _Sender:
+    """Router sender without a batch API (like the RabbitMQ adapter)."""
+
+    def __init__(self, fail_on=None):
+        self.sends = []
+        self.fail_on = fail_on
+
+    async def send_messages(self, payload):
+        messages = payload if isinstance(payload, list) else [payload]
+        if any(self.fail_on is not None and self.fail_on in message.body for message in messages):
+            raise RuntimeError("rejected")
+        self.sends.append(len(messages))
+
+
+class _MessageBatch:
+    """Stand-in for ServiceBusMessageBatch holding at most `capacity` messages."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.messages = []
+
+    def add_message(self, message):
+        if len(self.messages) >= self.capacity:
+            raise ValueError("batch full")
+        self.messages.append(message)
+
+
+class _BatchingSender(_Sender):
+    """Router sender with create_message_batch (like the Service Bus SDK)."""
+
+    def __init__(self, capacity=2, fail_create=False):
+        super().__init__()
+        self.capacity = capacity
+        self.fail_create = fail_create
+
+    async def create_message_batch(self):
+        if self.fail_create:
+            raise RuntimeError("link detached")
+        return _MessageBatch(self.capacity)
+
+    async def send_messages(self, payload):
+        if isinstance(payload, _MessageBatch):
+            payload = payload.messages
+        await super().send_messages(payload)
+
+
+class TestEventFlusher(unittest.TestCase):
+
+    def publish_all(self, sender, events):
+        """Publish events concurrently through a running flusher; return each caller's outcome."""
+
+        async def run():
+            worker = _Worker()
+            worker._event_queue = asyncio.Queue()
+            flusher = asyncio.create_task(worker._flush_events(sender))
+            try:
+                publishes = [worker._publish_event(None, event) for event in events]
+                return await asyncio.wait_for(asyncio.gather(*publishes, return_exceptions=True), 5)
+            finally:
+                flusher.cancel()
+
+        return asyncio.run(run())
+
+    def test_batched_events_resolve_on_success(self):
+        """Test that every caller returns once its batch is sent."""
+        sender = _Sender()
+        results = self.publish_all(sender, [{"job_id": str(i)} for i in range(5)])
+
+        self.assertEqual(results, [None] * 5)
+        self.assertEqual(sum(sender.sends), 5)
+        self.assertLess(len(sender.sends), 5)
+
+    def test_rejected_event_fails_only_its_caller(self):
+        """Test that a rejected batch is retried per event and only the bad event fails."""
+        sender = _Sender(fail_on=b"bad")
+        results = self.publish_all(sender, [{"job_id": "a"}, {"job_id": "bad"}, {"job_id": "c"}])
+
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertIsNone(results[2])
+
+    def test_full_message_batches_are_split(self):
+        """Test that events beyond the batch capacity go out in further batches."""
+        sender = _BatchingSender(capacity=2)
+        results = self.publish_all(sender, [{"job_id": str(i)} for i in range(5)])
+
+        self.assertEqual(results, [None] * 5)
+        self.assertEqual(sum(sender.sends), 5)
+        self.assertTrue(all(size <= 2 for size in sender.sends))
+
+    def test_batch_creation_failure_fails_callers_and_keeps_flushing(self):
+        """Test that a batching error reaches every caller instead of stalling them."""
+        sender = _BatchingSender(fail_create=True)
+        with self.assertLogs("common.base_worker", level="ERROR"):
+            results = self.publish_all(sender, [{"job_id": "a"}, {"job_id": "b"}])
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+        sender.fail_create = False
+        self.assertEqual(self.publish_all(sender, [{"job_id": "c"}]), [None])
+
+    def test_unserializable_event_raises_in_caller(self):
+        """Test that encoding errors surface in _publish_event, not in the flusher."""
+        results = self.publish_all(_Sender(), [{"job_id": "a", "result": {1, 2}}, {"job_id": "b"}])
+
+        self.assertIsInstance(results[0], TypeError)
+        self.assertIsNone(results[1])
+
+
+class _Message:
+    def __init__(self, index):
+        self.index = index
+
+
+class _Receiver:
+    """Queue receiver serving a fixed set of messages."""
+
+    def __init__(self, count):
+        self.pending = [_Message(i) for i in range(count)]
+        self.completed = []
+        self.renewals = 0
+
+    async def receive_messages(self, max_message_count, max_wait_time):
+        batch, self.pending = self.pending[:max_message_count], self.pending[max_message_count:]
+        if not batch:
+            await asyncio.sleep(0.01)
+        return batch
+
+    async def complete_message(self, msg):
+        self.completed.append(msg.index)
+
+    async def renew_message_lock(self, msg):
+        self.renewals += 1
+
+
+class TestMessageProcessing(unittest.TestCase):
+
+    def test_in_flight_messages_bounded_by_max_concurrency(self):
+        """Test that no more than max_concurrency messages are handled at once."""
+
+        async def run():
+            worker = _Worker()
+            worker.max_concurrency = 3
+            receiver = _Receiver(10)
+            active = peak = 0
+
+            async def handle_message(msg, sb_client):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                if len(receiver.completed) == 9:
+                    worker._request_shutdown()
+
+            worker.handle_message = handle_message
+            await asyncio.wait_for(worker._process_messages(receiver, None), 5)
+            return receiver, peak
+
+        receiver, peak = asyncio.run(run())
+        self.assertEqual(sorted(receiver.completed), list(range(10)))
+        self.assertLessEqual(peak, 3)
+
+    def test_lock_renewal_stops_after_completion(self):
+        """Test that message locks are renewed while handling and not after settlement."""
+
+        async def run():
+            worker = _Worker()
+            worker.lock_renew_interval_s = 0.01
+            receiver = _Receiver(1)
+
+            async def handle_message(msg, sb_client):
+                await asyncio.sleep(0.1)
+
+            worker.handle_message = handle_message
+            await worker._handle_and_complete(receiver, receiver.pending.pop(), None)
+            renewals = receiver.renewals
+            await asyncio.sleep(0.05)
+            return receiver, renewals
+
+        receiver, renewals = asyncio.run(run())
+        self.assertEqual(receiver.completed, [0])
+        self.assertGreater(renewals, 0)
+        self.assertEqual(receiver.renewals, renewals)
+
+
+if __name__ == "__main__":
+    unittest.main()